@@ -108,16 +108,15 @@ async def _try_api_token(token: str) -> AuthContext | None:
 
 async def validate_client_access(
     auth: AuthContext, client_id: str | UUID, pool=None
-) -> str:
-    """Verify client belongs to auth's org and user has access. Returns client_id as str."""
+) -> UUID:
+    """Verify client belongs to auth's org and user has access. Returns client_id as UUID."""
     if pool is None:
         pool = get_pool()
 
-    cid = str(client_id)
-    auth.assert_client_access(cid)
+    auth.assert_client_access(str(client_id))
 
     try:
-        db_client_id = UUID(cid) if isinstance(client_id, str) else client_id
+        db_client_id = client_id if isinstance(client_id, UUID) else UUID(client_id)
         db_org_id = UUID(auth.org_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Client not found")
@@ -130,4 +129,4 @@ async def validate_client_access(
     if row is None:
         raise HTTPException(status_code=404, detail="Client not found")
 
-    return cid
+    return db_client_id
@@ -16,7 +16,7 @@ from app.routers.push import router as push_router
 from app.routers.topology import router as topology_router
 from app.routers.tokens import router as tokens_router
 from app.routers.users import router as users_router
-from app.routers.workflows import router as workflows_router
+from app.routers.workflows import drain_background_deploys, router as workflows_router
 from app.config import settings
 from app.db import close_pool, init_pool
 from app.services.sfdc_client import close_sfdc_client, init_sfdc_client
@@ -27,6 +27,7 @@ async def lifespan(app: FastAPI):
     await init_pool(settings.database_url)
     await init_sfdc_client()
     yield
+    await drain_background_deploys()
     await close_sfdc_client()
     await close_pool()
 
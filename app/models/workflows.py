@@ -33,7 +33,7 @@ class WorkflowDeployRequest(BaseModel):
 
 
 class WorkflowDeployResponse(BaseModel):
-    id: str
+    id: UUID
     status: str
     deployment_type: str
     deployed_at: str | None
@@ -47,8 +47,21 @@ class WorkflowRemoveRequest(BaseModel):
 
 
 class WorkflowRemoveResponse(BaseModel):
-    id: str
+    id: UUID
     status: str
     deployment_type: str
     deployed_at: str | None
     result: dict | None
+
+
+class WorkflowStatusRequest(BaseModel):
+    id: UUID
+
+
+class WorkflowStatusResponse(BaseModel):
+    id: UUID
+    status: str
+    deployment_type: str
+    deployed_at: str | None
+    result: dict | None
+    error_message: str | None
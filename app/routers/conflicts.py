@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.auth.dependencies import get_current_auth, validate_client_access
@@ -11,6 +9,7 @@ from app.models.conflicts import (
     ConflictGetRequest,
     ConflictGetResponse,
 )
+from app.services import connection_cache
 from app.services.conflict_checker import check_conflicts
 
 router = APIRouter(prefix="/api/conflicts", tags=["conflicts"])
@@ -24,8 +23,7 @@ async def conflict_check(
     auth.assert_permission("deploy.write")
 
     pool = get_pool()
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     topology_row = await pool.fetchrow(
         """
@@ -45,16 +43,8 @@ async def conflict_check(
             detail="No topology snapshot found - run a topology pull first.",
         )
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
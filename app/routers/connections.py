@@ -5,7 +5,7 @@ from pydantic import BaseModel
 
 from app.auth.dependencies import get_current_auth, validate_client_access
 from app.db import get_pool
-from app.services import token_manager
+from app.services import connection_cache, token_manager
 
 router = APIRouter(prefix="/api/connections", tags=["connections"])
 
@@ -91,7 +91,7 @@ class ConnectionRevokeResponse(BaseModel):
     status: str
 
 
-async def _get_nango_connection_row(pool, org_id: str, client_id: str):
+async def _get_nango_connection_row(pool, org_id: str, client_id: UUID):
     """Look up Nango connection metadata. Raises 400 if not found."""
     row = await pool.fetchrow(
         """
@@ -154,9 +154,10 @@ async def create_connection(
     pool = get_pool()
 
     client_id = await validate_client_access(auth, body.client_id, pool=pool)
+    nango_connection_id = str(client_id)
     connect_session = await token_manager.create_connect_session(
         auth.org_id,
-        client_id,
+        nango_connection_id,
         provider_config_key=body.nango_provider_config_key,
     )
 
@@ -183,9 +184,10 @@ async def create_connection(
         """,
         auth.org_id,
         client_id,
-        client_id,
+        nango_connection_id,
         body.nango_provider_config_key,
     )
+    connection_cache.invalidate_connection(auth.org_id, client_id)
     if row is None:
         raise HTTPException(status_code=500, detail="Failed to create CRM connection")
 
@@ -281,6 +283,7 @@ async def confirm_connection_callback(
         sfdc_user_id,
         resolved_provider_config_key,
     )
+    connection_cache.invalidate_connection(auth.org_id, client_id)
     if row is None:
         raise HTTPException(status_code=404, detail="Connection not found")
 
@@ -409,6 +412,7 @@ async def refresh_connection(
                 auth.org_id,
                 client_id,
             )
+            connection_cache.invalidate_connection(auth.org_id, client_id)
         raise
 
     row = await pool.fetchrow(
@@ -424,6 +428,7 @@ async def refresh_connection(
         auth.org_id,
         client_id,
     )
+    connection_cache.invalidate_connection(auth.org_id, client_id)
     if row is None:
         raise HTTPException(status_code=404, detail="Connection not found")
 
@@ -459,6 +464,7 @@ async def revoke_connection(
         auth.org_id,
         client_id,
     )
+    connection_cache.invalidate_connection(auth.org_id, client_id)
     if command_status.endswith("0"):
         raise HTTPException(status_code=404, detail="Connection not found")
 
@@ -21,7 +21,7 @@ from app.models.crm import (
     SOQLRequest,
     SOQLResponse,
 )
-from app.services import salesforce
+from app.services import connection_cache, salesforce
 
 router = APIRouter(prefix="/api", tags=["crm"])
 
@@ -47,23 +47,15 @@ _NEXT_RECORDS_RE = re.compile(
 
 
 async def _get_active_connection(
-    auth: AuthContext, client_id: str, pool=None
+    auth: AuthContext, client_id: str | UUID, pool=None
 ) -> dict:
     """Look up the active Salesforce connection for a client."""
     if pool is None:
         pool = get_pool()
-    db_client_id = UUID(client_id)
-
-    row = await pool.fetchrow(
-        """
-        SELECT nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    db_client_id = client_id if isinstance(client_id, UUID) else UUID(client_id)
+
+    row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if row is None:
         raise HTTPException(status_code=404, detail="No active Salesforce connection")
@@ -15,7 +15,7 @@ from app.models.deployments import (
     RollbackRequest,
     RollbackResponse,
 )
-from app.services import deploy_service
+from app.services import connection_cache, deploy_service
 
 router = APIRouter(prefix="/api/deploy", tags=["deploy"])
 
@@ -32,6 +32,9 @@ def _format_deploy_error_message(error: Exception) -> str:
 
 
 def _resolve_db_deployment_status(status: str) -> str:
+    # An empty plan has nothing to fail; the deployment_status enum has no "noop".
+    if status == "noop":
+        return "succeeded"
     valid = {"pending", "in_progress", "succeeded", "partial", "failed", "rolled_back"}
     return status if status in valid else "failed"
 
@@ -44,19 +47,10 @@ async def deploy_execute(
     auth.assert_permission("deploy.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id, nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
@@ -160,16 +154,7 @@ async def deploy_execute(
             raise
         raise HTTPException(status_code=500, detail="Failed to execute deployment") from error
     finally:
-        await pool.execute(
-            """
-            UPDATE crm_connections
-            SET last_used_at = NOW()
-            WHERE id = $1
-              AND org_id = $2
-            """,
-            connection_row["id"],
-            auth.org_id,
-        )
+        await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     if updated_row is None:
         raise HTTPException(status_code=500, detail="Failed to finalize deployment record")
@@ -225,8 +210,7 @@ async def deploy_history(
     auth.assert_permission("deploy.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     rows = await pool.fetch(
         """
@@ -266,7 +250,7 @@ async def deploy_rollback(
 
     deployment_row = await pool.fetchrow(
         """
-        SELECT id, client_id, connection_id, result
+        SELECT id, client_id, connection_id, result, plan
         FROM crm_deployments
         WHERE id = $1
           AND org_id = $2
@@ -307,6 +291,7 @@ async def deploy_rollback(
         nango_connection_id=connection_row["nango_connection_id"],
         deployment_result=deployment_result,
         provider_config_key=connection_row["nango_provider_config_key"],
+        deployment_plan=deployment_row["plan"] if isinstance(deployment_row["plan"], dict) else None,
     )
     updated_result = dict(deployment_result)
     updated_result["rollback"] = rollback_result
@@ -328,16 +313,7 @@ async def deploy_rollback(
     if updated_row is None:
         raise HTTPException(status_code=500, detail="Failed to update deployment rollback status")
 
-    await pool.execute(
-        """
-        UPDATE crm_connections
-        SET last_used_at = NOW()
-        WHERE id = $1
-          AND org_id = $2
-        """,
-        connection_row["id"],
-        auth.org_id,
-    )
+    await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     return RollbackResponse(
         id=str(updated_row["id"]),
@@ -355,19 +331,10 @@ async def deploy_analytics(
     auth.assert_permission("deploy.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id, nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
@@ -468,16 +435,7 @@ async def deploy_analytics(
             raise
         raise HTTPException(status_code=500, detail="Failed to execute deployment") from error
     finally:
-        await pool.execute(
-            """
-            UPDATE crm_connections
-            SET last_used_at = NOW()
-            WHERE id = $1
-              AND org_id = $2
-            """,
-            connection_row["id"],
-            auth.org_id,
-        )
+        await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     if updated_row is None:
         raise HTTPException(status_code=500, detail="Failed to finalize deployment record")
@@ -563,16 +521,7 @@ async def deploy_analytics_rollback(
     if updated_row is None:
         raise HTTPException(status_code=500, detail="Failed to update deployment rollback status")
 
-    await pool.execute(
-        """
-        UPDATE crm_connections
-        SET last_used_at = NOW()
-        WHERE id = $1
-          AND org_id = $2
-        """,
-        connection_row["id"],
-        auth.org_id,
-    )
+    await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     return RollbackResponse(
         id=str(updated_row["id"]),
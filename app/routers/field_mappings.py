@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.auth.dependencies import get_current_auth, validate_client_access
@@ -39,8 +37,7 @@ async def set_field_mapping(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     row = await pool.fetchrow(
         """
@@ -84,8 +81,7 @@ async def list_field_mappings(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     rows = await pool.fetch(
         """
@@ -112,8 +108,7 @@ async def get_field_mapping(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     row = await pool.fetchrow(
         """
@@ -143,8 +138,7 @@ async def delete_field_mapping(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     row = await pool.fetchrow(
         """
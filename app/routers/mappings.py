@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from asyncpg.exceptions import UniqueViolationError
 from fastapi import APIRouter, Depends, HTTPException
 
@@ -42,8 +40,7 @@ async def create_mapping(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     try:
         row = await pool.fetchrow(
@@ -98,8 +95,7 @@ async def get_mapping(
     auth.assert_permission("push.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     row = await pool.fetchrow(
         """
@@ -129,8 +125,7 @@ async def list_mappings(
     auth.assert_permission("push.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     rows = await pool.fetch(
         """
@@ -157,8 +152,7 @@ async def update_mapping(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     updates: list[str] = []
     args: list[object] = [auth.org_id, db_client_id, body.canonical_object]
@@ -205,8 +199,7 @@ async def deactivate_mapping(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     row = await pool.fetchrow(
         """
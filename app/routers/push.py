@@ -15,7 +15,7 @@ from app.models.push import (
     PushValidateRequest,
     PushValidateResponse,
 )
-from app.services import push_service
+from app.services import connection_cache, push_service
 
 router = APIRouter(prefix="/api/push", tags=["push"])
 
@@ -62,19 +62,10 @@ async def push_records(
     auth.assert_permission("push.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id, nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
@@ -216,16 +207,7 @@ async def push_records(
             raise
         raise HTTPException(status_code=500, detail="Failed to push records") from error
     finally:
-        await pool.execute(
-            """
-            UPDATE crm_connections
-            SET last_used_at = NOW()
-            WHERE id = $1
-              AND org_id = $2
-            """,
-            connection_row["id"],
-            auth.org_id,
-        )
+        await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     if updated_row is None:
         raise HTTPException(status_code=500, detail="Failed to finalize push log")
@@ -248,8 +230,7 @@ async def push_validate(
     auth.assert_permission("push.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     mapping_row = await pool.fetchrow(
         """
@@ -361,8 +342,7 @@ async def push_history(
     auth.assert_permission("push.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     rows = await pool.fetch(
         """
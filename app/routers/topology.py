@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.auth.dependencies import get_current_auth, validate_client_access
@@ -19,7 +17,7 @@ from app.models.topology import (
     TopologyPullRequest,
     TopologyPullResponse,
 )
-from app.services import salesforce
+from app.services import connection_cache, salesforce
 
 router = APIRouter(prefix="/api/topology", tags=["topology"])
 
@@ -33,19 +31,10 @@ async def pull_topology(
     auth.assert_permission("connections.write")
 
     pool = get_pool()
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id, nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
@@ -95,16 +84,7 @@ async def pull_topology(
     if row is None:
         raise HTTPException(status_code=500, detail="Failed to store topology snapshot")
 
-    await pool.execute(
-        """
-        UPDATE crm_connections
-        SET last_used_at = NOW()
-        WHERE id = $1
-          AND org_id = $2
-        """,
-        connection_row["id"],
-        auth.org_id,
-    )
+    await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     return TopologyPullResponse(
         id=str(row["id"]),
@@ -124,8 +104,7 @@ async def get_topology(
     auth.assert_permission("topology.read")
 
     pool = get_pool()
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     if body.version is None:
         row = await pool.fetchrow(
@@ -176,8 +155,7 @@ async def topology_history(
     auth.assert_permission("topology.read")
 
     pool = get_pool()
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     rows = await pool.fetch(
         """
@@ -213,8 +191,7 @@ async def picklist(
     auth.assert_permission("topology.read")
 
     pool = get_pool()
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     if body.version is None:
         row = await pool.fetchrow(
@@ -278,8 +255,7 @@ async def topology_diff(
     auth.assert_permission("topology.read")
 
     pool = get_pool()
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     rows = await pool.fetch(
         """
@@ -1,7 +1,7 @@
-import bcrypt
 from uuid import UUID
 
 import asyncpg
+import bcrypt
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
@@ -24,21 +24,21 @@ class UsersListRequest(BaseModel):
 
 
 class UserCreateResponse(BaseModel):
-    id: str
-    org_id: str
+    id: UUID
+    org_id: UUID
     email: str
     name: str | None
     role: str
-    client_id: str | None
+    client_id: UUID | None
     created_at: str
 
 
 class UserListItem(BaseModel):
-    id: str
+    id: UUID
     email: str
     name: str | None
     role: str
-    client_id: str | None
+    client_id: UUID | None
     is_active: bool
     created_at: str
 
@@ -47,7 +47,7 @@ class UsersListResponse(BaseModel):
     data: list[UserListItem]
 
 
-def _validate_user_scope(role: str, client_id: str | None) -> None:
+def _validate_user_scope(role: str, client_id: UUID | None) -> None:
     company_roles = {"company_admin", "company_member"}
     if role == "org_admin" and client_id is not None:
         raise HTTPException(
@@ -70,7 +70,7 @@ async def create_user(
     _validate_user_scope(body.role, body.client_id)
 
     pool = get_pool()
-    client_id: str | None = None
+    client_id: UUID | None = None
     if body.client_id is not None:
         client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
@@ -99,16 +99,25 @@ async def create_user(
         raise HTTPException(status_code=500, detail="Failed to create user")
 
     return UserCreateResponse(
-        id=str(row["id"]),
-        org_id=str(row["org_id"]),
+        id=row["id"],
+        org_id=row["org_id"],
         email=row["email"],
         name=row["name"],
         role=row["role"],
-        client_id=str(row["client_id"]) if row["client_id"] else None,
+        client_id=row["client_id"],
         created_at=row["created_at"].isoformat(),
     )
 
 
+LIST_USERS_SQL = """
+SELECT id, email, name, role::text AS role, client_id, is_active, created_at
+FROM users
+WHERE org_id = $1
+  AND is_active = TRUE
+ORDER BY created_at DESC
+"""
+
+
 @router.post("/list", response_model=UsersListResponse)
 async def list_users(
     _: UsersListRequest,
@@ -117,25 +126,18 @@ async def list_users(
     auth.assert_permission("org.manage")
     pool = get_pool()
 
-    rows = await pool.fetch(
-        """
-        SELECT id, email, name, role::text AS role, client_id, is_active, created_at
-        FROM users
-        WHERE org_id = $1
-          AND is_active = TRUE
-        ORDER BY created_at DESC
-        """,
-        auth.org_id,
-    )
+    # The list is org-scoped and small; fetching it whole keeps DB errors on the
+    # 5xx path instead of truncating an already-started response body.
+    rows = await pool.fetch(LIST_USERS_SQL, auth.org_id)
 
     return UsersListResponse(
         data=[
             UserListItem(
-                id=str(row["id"]),
+                id=row["id"],
                 email=row["email"],
                 name=row["name"],
                 role=row["role"],
-                client_id=str(row["client_id"]) if row["client_id"] else None,
+                client_id=row["client_id"],
                 is_active=row["is_active"],
                 created_at=row["created_at"].isoformat(),
             )
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -13,11 +15,37 @@ from app.models.workflows import (
     WorkflowListResponse,
     WorkflowRemoveRequest,
     WorkflowRemoveResponse,
+    WorkflowStatusRequest,
+    WorkflowStatusResponse,
 )
-from app.services import deploy_service, salesforce
+from app.services import connection_cache, deploy_service, salesforce
+from app.services.deploy_validators import (
+    MAX_REPORTED_VALIDATION_ERRORS,
+    validate_workflow_plan,
+    validation_error_details,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/workflows", tags=["workflows"])
 
+# Metadata API deploys run for seconds to minutes; cap how many run at once per process.
+_MAX_CONCURRENT_BACKGROUND_DEPLOYS = 4
+_background_deploy_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_BACKGROUND_DEPLOYS)
+_background_deploy_tasks: set[asyncio.Task] = set()
+# On shutdown, running deploys get this long to finish before they are cancelled.
+BACKGROUND_DEPLOY_DRAIN_TIMEOUT_SECONDS = 30.0
+_SHUTDOWN_INTERRUPTED_MESSAGE = "deployment_interrupted: Server shut down before the deployment finished"
+
+_FLOW_DEFINITIONS_SOQL = (
+    "SELECT Id, DeveloperName, ActiveVersionId, LatestVersionId "
+    "FROM FlowDefinition ORDER BY DeveloperName"
+)
+_ACTIVE_ASSIGNMENT_RULES_SOQL = (
+    "SELECT Id, Name, SobjectType, Active "
+    "FROM AssignmentRule WHERE Active = true ORDER BY SobjectType, Name"
+)
+
 
 def _format_workflow_error_message(error: Exception) -> str:
     if isinstance(error, HTTPException):
@@ -31,6 +59,9 @@ def _format_workflow_error_message(error: Exception) -> str:
 
 
 def _resolve_db_deployment_status(status: str) -> str:
+    # An empty plan has nothing to fail; the deployment_status enum has no "noop".
+    if status == "noop":
+        return "succeeded"
     valid = {"pending", "in_progress", "succeeded", "partial", "failed", "rolled_back"}
     return status if status in valid else "failed"
 
@@ -47,6 +78,94 @@ def _resolve_workflow_deployment_type(plan: dict) -> str:
     return "workflow"
 
 
+async def _run_workflow_deployment(
+    *,
+    pool,
+    deployment_id: UUID,
+    org_id: str,
+    connection_id: UUID,
+    nango_connection_id: str,
+    provider_config_key: str | None,
+    plan: dict,
+) -> None:
+    """Execute a workflow deploy in the background and record the outcome on its row."""
+    try:
+        async with _background_deploy_semaphore:
+            deploy_result = await deploy_service.execute_workflow_deployment(
+                nango_connection_id=nango_connection_id,
+                plan=plan,
+                provider_config_key=provider_config_key,
+                validated=True,
+            )
+            await pool.execute(
+                """
+                UPDATE crm_deployments
+                SET result = $1,
+                    status = $2::deployment_status,
+                    deployed_at = NOW(),
+                    error_message = NULL
+                WHERE id = $3
+                  AND org_id = $4
+                """,
+                deploy_result,
+                _resolve_db_deployment_status(str(deploy_result.get("status", "failed"))),
+                deployment_id,
+                org_id,
+            )
+    except asyncio.CancelledError:
+        logger.warning(
+            "Background workflow deployment cancelled",
+            extra={"org_id": org_id, "deployment_id": str(deployment_id)},
+        )
+        await pool.execute(
+            """
+            UPDATE crm_deployments
+            SET status = 'failed'::deployment_status,
+                error_message = $1
+            WHERE id = $2
+              AND org_id = $3
+            """,
+            _SHUTDOWN_INTERRUPTED_MESSAGE,
+            deployment_id,
+            org_id,
+        )
+        raise
+    except Exception as error:
+        logger.exception(
+            "Background workflow deployment failed",
+            extra={"org_id": org_id, "deployment_id": str(deployment_id)},
+        )
+        await pool.execute(
+            """
+            UPDATE crm_deployments
+            SET status = 'failed'::deployment_status,
+                error_message = $1
+            WHERE id = $2
+              AND org_id = $3
+            """,
+            _format_workflow_error_message(error),
+            deployment_id,
+            org_id,
+        )
+    finally:
+        await connection_cache.touch_last_used(pool, connection_id, org_id)
+
+
+async def drain_background_deploys(timeout: float = BACKGROUND_DEPLOY_DRAIN_TIMEOUT_SECONDS) -> None:
+    """Wait for in-flight background deploys, cancelling any still running after timeout.
+
+    Must run before the DB pool and Salesforce client close: cancelled deploys
+    record themselves as failed on their way out.
+    """
+    if not _background_deploy_tasks:
+        return
+    tasks = set(_background_deploy_tasks)
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 @router.post("/list", response_model=WorkflowListResponse)
 async def workflows_list(
     body: WorkflowListRequest,
@@ -55,19 +174,10 @@ async def workflows_list(
     auth.assert_permission("workflows.read")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id, nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
@@ -79,31 +189,16 @@ async def workflows_list(
     try:
         flow_rows = await salesforce.tooling_query(
             nango_connection_id=nango_connection_id,
-            soql=(
-                "SELECT Id, DeveloperName, ActiveVersionId, LatestVersionId "
-                "FROM FlowDefinition ORDER BY DeveloperName"
-            ),
+            soql=_FLOW_DEFINITIONS_SOQL,
             provider_config_key=connection_row["nango_provider_config_key"],
         )
         assignment_rule_rows = await salesforce.tooling_query(
             nango_connection_id=nango_connection_id,
-            soql=(
-                "SELECT Id, Name, SobjectType, Active "
-                "FROM AssignmentRule WHERE Active = true ORDER BY SobjectType, Name"
-            ),
+            soql=_ACTIVE_ASSIGNMENT_RULES_SOQL,
             provider_config_key=connection_row["nango_provider_config_key"],
         )
     finally:
-        await pool.execute(
-            """
-            UPDATE crm_connections
-            SET last_used_at = NOW()
-            WHERE id = $1
-              AND org_id = $2
-            """,
-            connection_row["id"],
-            auth.org_id,
-        )
+        await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     flows = [
         WorkflowFlowSummary(
@@ -140,19 +235,10 @@ async def workflows_deploy(
     auth.assert_permission("workflows.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id, nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
@@ -177,6 +263,7 @@ async def workflows_deploy(
         if conflict_row is None:
             raise HTTPException(status_code=400, detail="Conflict report not found for this org/client")
 
+    deployment_type = _resolve_workflow_deployment_type(body.plan)
     deployment_row = await pool.fetchrow(
         """
         INSERT INTO crm_deployments (
@@ -205,7 +292,7 @@ async def workflows_deploy(
         db_client_id,
         connection_row["id"],
         UUID(auth.user_id),
-        _resolve_workflow_deployment_type(body.plan),
+        deployment_type,
         body.plan,
         body.conflict_report_id,
     )
@@ -214,30 +301,12 @@ async def workflows_deploy(
 
     deployment_id = deployment_row["id"]
 
-    try:
-        deploy_result = await deploy_service.execute_workflow_deployment(
-            nango_connection_id=nango_connection_id,
-            plan=body.plan,
-            provider_config_key=connection_row["nango_provider_config_key"],
-        )
-        updated_row = await pool.fetchrow(
-            """
-            UPDATE crm_deployments
-            SET result = $1,
-                status = $2::deployment_status,
-                deployed_at = NOW(),
-                error_message = NULL
-            WHERE id = $3
-              AND org_id = $4
-            RETURNING id, status::text AS status, deployment_type::text AS deployment_type, deployed_at, result
-            """,
-            deploy_result,
-            _resolve_db_deployment_status(str(deploy_result.get("status", "failed"))),
-            deployment_id,
-            auth.org_id,
+    validation_errors = validate_workflow_plan(body.plan, max_errors=MAX_REPORTED_VALIDATION_ERRORS)
+    if validation_errors:
+        validation_error = HTTPException(
+            status_code=400,
+            detail={"code": "invalid_deploy_plan", "errors": validation_error_details(validation_errors)},
         )
-    except Exception as error:
-        error_message = _format_workflow_error_message(error)
         await pool.execute(
             """
             UPDATE crm_deployments
@@ -246,34 +315,67 @@ async def workflows_deploy(
             WHERE id = $2
               AND org_id = $3
             """,
-            error_message,
+            _format_workflow_error_message(validation_error),
             deployment_id,
             auth.org_id,
         )
-        if isinstance(error, HTTPException):
-            raise
-        raise HTTPException(status_code=500, detail="Failed to deploy workflows") from error
-    finally:
-        await pool.execute(
-            """
-            UPDATE crm_connections
-            SET last_used_at = NOW()
-            WHERE id = $1
-              AND org_id = $2
-            """,
-            connection_row["id"],
-            auth.org_id,
+        raise validation_error
+
+    task = asyncio.create_task(
+        _run_workflow_deployment(
+            pool=pool,
+            deployment_id=deployment_id,
+            org_id=auth.org_id,
+            connection_id=connection_row["id"],
+            nango_connection_id=nango_connection_id,
+            provider_config_key=connection_row["nango_provider_config_key"],
+            plan=body.plan,
         )
-
-    if updated_row is None:
-        raise HTTPException(status_code=500, detail="Failed to finalize deployment record")
+    )
+    _background_deploy_tasks.add(task)
+    task.add_done_callback(_background_deploy_tasks.discard)
 
     return WorkflowDeployResponse(
-        id=str(updated_row["id"]),
-        status=updated_row["status"],
-        deployment_type=updated_row["deployment_type"],
-        deployed_at=updated_row["deployed_at"].isoformat() if updated_row["deployed_at"] else None,
-        result=dict(updated_row["result"]) if isinstance(updated_row["result"], dict) else None,
+        id=deployment_id,
+        status="in_progress",
+        deployment_type=deployment_type,
+        deployed_at=None,
+        result=None,
+    )
+
+
+@router.post("/status", response_model=WorkflowStatusResponse)
+async def workflows_status(
+    body: WorkflowStatusRequest,
+    auth=Depends(get_current_auth),
+) -> WorkflowStatusResponse:
+    auth.assert_permission("workflows.read")
+    pool = get_pool()
+
+    row = await pool.fetchrow(
+        """
+        SELECT id, client_id, status::text AS status, deployment_type::text AS deployment_type,
+               deployed_at, result, error_message
+        FROM crm_deployments
+        WHERE id = $1
+          AND org_id = $2
+          AND deployment_type IN ('workflow'::deployment_type, 'assignment_rule'::deployment_type)
+        """,
+        body.id,
+        auth.org_id,
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Deployment not found")
+
+    await validate_client_access(auth, row["client_id"], pool=pool)
+
+    return WorkflowStatusResponse(
+        id=row["id"],
+        status=row["status"],
+        deployment_type=row["deployment_type"],
+        deployed_at=row["deployed_at"].isoformat() if row["deployed_at"] else None,
+        result=dict(row["result"]) if isinstance(row["result"], dict) else None,
+        error_message=row["error_message"],
     )
 
 
@@ -285,8 +387,7 @@ async def workflows_remove(
     auth.assert_permission("workflows.write")
     pool = get_pool()
 
-    client_id = await validate_client_access(auth, body.client_id, pool=pool)
-    db_client_id = UUID(client_id)
+    db_client_id = await validate_client_access(auth, body.client_id, pool=pool)
 
     flow_api_names = [str(name).strip() for name in body.flow_api_names if str(name).strip()]
     assignment_rule_objects = [
@@ -298,16 +399,8 @@ async def workflows_remove(
             detail="At least one flow_api_name or assignment_rule_object is required",
         )
 
-    connection_row = await pool.fetchrow(
-        """
-        SELECT id, nango_connection_id, nango_provider_config_key
-        FROM crm_connections
-        WHERE org_id = $1
-          AND client_id = $2
-          AND status = 'connected'
-        """,
-        auth.org_id,
-        db_client_id,
+    connection_row = await connection_cache.get_connected_connection(
+        pool, auth.org_id, db_client_id
     )
     if connection_row is None:
         raise HTTPException(status_code=400, detail="No connected Salesforce connection found")
@@ -398,22 +491,13 @@ async def workflows_remove(
             raise
         raise HTTPException(status_code=500, detail="Failed to remove workflows") from error
     finally:
-        await pool.execute(
-            """
-            UPDATE crm_connections
-            SET last_used_at = NOW()
-            WHERE id = $1
-              AND org_id = $2
-            """,
-            connection_row["id"],
-            auth.org_id,
-        )
+        await connection_cache.touch_last_used(pool, connection_row["id"], auth.org_id)
 
     if updated_row is None:
         raise HTTPException(status_code=500, detail="Failed to finalize deployment record")
 
     return WorkflowRemoveResponse(
-        id=str(updated_row["id"]),
+        id=updated_row["id"],
         status=updated_row["status"],
         deployment_type=updated_row["deployment_type"],
         deployed_at=updated_row["deployed_at"].isoformat() if updated_row["deployed_at"] else None,
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 PLAN_TYPE_TO_SFDC_TYPE = {
     "Text": "string",
     "Number": "double",
@@ -25,19 +27,23 @@ def _normalize_type(plan_type: str | None) -> str | None:
     return mapped.lower()
 
 
-def _build_field_map(object_payload: dict) -> dict[str, dict]:
-    fields = object_payload.get("fields", [])
-    if not isinstance(fields, list):
-        return {}
+def _dict_entries(value: object) -> list[dict]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
 
-    field_map: dict[str, dict] = {}
-    for field in fields:
-        if not isinstance(field, dict):
-            continue
-        field_name = field.get("name")
-        if isinstance(field_name, str) and field_name:
-            field_map[field_name] = field
-    return field_map
+
+def _named_entries(value: object, name_key: str) -> list[tuple[str, dict]]:
+    named: list[tuple[str, dict]] = []
+    for item in _dict_entries(value):
+        name = item.get(name_key)
+        if isinstance(name, str) and name:
+            named.append((name, item))
+    return named
+
+
+def _build_field_map(object_payload: dict) -> dict[str, dict]:
+    return dict(_named_entries(object_payload.get("fields", []), "name"))
 
 
 def _is_required_field(field: dict) -> bool:
@@ -77,213 +83,166 @@ def _has_active_validation_rules(object_payload: dict) -> bool:
     return False
 
 
-def _append_finding(findings: list[dict], severity: str, category: str, message: str) -> None:
-    findings.append(
-        {
-            "severity": severity,
-            "category": category,
-            "message": message,
-        }
-    )
-
+@dataclass(slots=True)
+class Finding:
+    severity: str
+    category: str
+    message: str
 
-def check_conflicts(deployment_plan: dict, topology_snapshot: dict) -> dict:
-    findings: list[dict] = []
-    objects = topology_snapshot.get("objects", {})
-    if not isinstance(objects, dict):
-        objects = {}
-
-    custom_objects = deployment_plan.get("custom_objects", [])
-    if isinstance(custom_objects, list):
-        for custom_object in custom_objects:
-            if not isinstance(custom_object, dict):
-                continue
-
-            object_name = custom_object.get("api_name")
-            if not isinstance(object_name, str) or not object_name:
-                continue
+    def as_dict(self) -> dict:
+        return {
+            "severity": self.severity,
+            "category": self.category,
+            "message": self.message,
+        }
 
-            object_payload = objects.get(object_name)
-            object_exists = isinstance(object_payload, dict)
 
-            if object_exists:
-                _append_finding(
-                    findings,
-                    severity="red",
-                    category="object_name",
-                    message=f"{object_name} already exists in topology snapshot",
-                )
-            else:
-                _append_finding(
-                    findings,
-                    severity="green",
-                    category="object_name",
-                    message=f"{object_name} does not exist - safe to create",
-                )
+def _append_finding(findings: list[Finding], severity: str, category: str, message: str) -> None:
+    findings.append(Finding(severity, category, message))
+
+
+def _append_field_finding(
+    findings: list[Finding],
+    object_name: str,
+    field_name: str,
+    existing_field: dict | None,
+    plan_field: dict,
+) -> None:
+    if existing_field is None:
+        _append_finding(
+            findings,
+            severity="green",
+            category="field_name",
+            message=f"{object_name}.{field_name} does not exist - safe to create",
+        )
+        return
+
+    existing_type = str(existing_field.get("type", "")).lower()
+    plan_type = _normalize_type(plan_field.get("type"))
+    if plan_type is None:
+        plan_type = str(plan_field.get("type", "")).lower()
+
+    if existing_type == plan_type:
+        _append_finding(
+            findings,
+            severity="yellow",
+            category="field_name",
+            message=(
+                f"{object_name}.{field_name} already exists with same type "
+                f"({existing_type})"
+            ),
+        )
+    else:
+        _append_finding(
+            findings,
+            severity="red",
+            category="field_name",
+            message=(
+                f"{object_name}.{field_name} already exists with different type "
+                f"(existing={existing_type}, requested={plan_type})"
+            ),
+        )
 
-            if not object_exists:
-                continue
 
-            field_map = _build_field_map(object_payload)
-            plan_fields = custom_object.get("fields", [])
-            if not isinstance(plan_fields, list):
-                continue
+def check_conflicts(deployment_plan: dict, topology_snapshot: dict) -> dict:
+    findings: list[Finding] = []
+
+    # Normalize once so the loops below work on known-good shapes only.
+    objects_raw = topology_snapshot.get("objects", {})
+    objects: dict[str, dict] = (
+        {name: payload for name, payload in objects_raw.items() if isinstance(payload, dict)}
+        if isinstance(objects_raw, dict)
+        else {}
+    )
+    custom_objects = _named_entries(deployment_plan.get("custom_objects", []), "api_name")
+    standard_objects = _named_entries(deployment_plan.get("standard_object_fields", []), "object")
 
-            for plan_field in plan_fields:
-                if not isinstance(plan_field, dict):
-                    continue
-
-                field_name = plan_field.get("api_name")
-                if not isinstance(field_name, str) or not field_name:
-                    continue
-
-                existing_field = field_map.get(field_name)
-                if existing_field is None:
-                    _append_finding(
-                        findings,
-                        severity="green",
-                        category="field_name",
-                        message=f"{object_name}.{field_name} does not exist - safe to create",
-                    )
-                    continue
-
-                existing_type = str(existing_field.get("type", "")).lower()
-                plan_type = _normalize_type(plan_field.get("type"))
-                if plan_type is None:
-                    plan_type = str(plan_field.get("type", "")).lower()
-
-                if existing_type == plan_type:
-                    _append_finding(
-                        findings,
-                        severity="yellow",
-                        category="field_name",
-                        message=(
-                            f"{object_name}.{field_name} already exists with same type "
-                            f"({existing_type})"
-                        ),
-                    )
-                else:
-                    _append_finding(
-                        findings,
-                        severity="red",
-                        category="field_name",
-                        message=(
-                            f"{object_name}.{field_name} already exists with different type "
-                            f"(existing={existing_type}, requested={plan_type})"
-                        ),
-                    )
-
-    standard_object_fields = deployment_plan.get("standard_object_fields", [])
-    if isinstance(standard_object_fields, list):
-        for standard_object in standard_object_fields:
-            if not isinstance(standard_object, dict):
-                continue
+    for object_name, custom_object in custom_objects:
+        object_payload = objects.get(object_name)
+        if object_payload is None:
+            _append_finding(
+                findings,
+                severity="green",
+                category="object_name",
+                message=f"{object_name} does not exist - safe to create",
+            )
+            continue
 
-            object_name = standard_object.get("object")
-            if not isinstance(object_name, str) or not object_name:
-                continue
+        _append_finding(
+            findings,
+            severity="red",
+            category="object_name",
+            message=f"{object_name} already exists in topology snapshot",
+        )
 
-            object_payload = objects.get(object_name)
-            if not isinstance(object_payload, dict):
-                _append_finding(
-                    findings,
-                    severity="red",
-                    category="standard_object",
-                    message=f"{object_name} not found in topology snapshot",
-                )
-                continue
+        field_map = _build_field_map(object_payload)
+        for field_name, plan_field in _named_entries(custom_object.get("fields", []), "api_name"):
+            _append_field_finding(
+                findings,
+                object_name,
+                field_name,
+                field_map.get(field_name),
+                plan_field,
+            )
 
+    for object_name, standard_object in standard_objects:
+        object_payload = objects.get(object_name)
+        if object_payload is None:
             _append_finding(
                 findings,
-                severity="green",
+                severity="red",
                 category="standard_object",
-                message=f"{object_name} exists in topology snapshot",
+                message=f"{object_name} not found in topology snapshot",
+            )
+            continue
+
+        _append_finding(
+            findings,
+            severity="green",
+            category="standard_object",
+            message=f"{object_name} exists in topology snapshot",
+        )
+
+        field_map = _build_field_map(object_payload)
+        planned_field_names: set[str] = set()
+        for field_name, plan_field in _named_entries(standard_object.get("fields", []), "api_name"):
+            planned_field_names.add(field_name)
+            _append_field_finding(
+                findings,
+                object_name,
+                field_name,
+                field_map.get(field_name),
+                plan_field,
             )
 
-            field_map = _build_field_map(object_payload)
-            plan_fields = standard_object.get("fields", [])
-            if not isinstance(plan_fields, list):
-                plan_fields = []
-
-            planned_field_names: set[str] = set()
-            for plan_field in plan_fields:
-                if not isinstance(plan_field, dict):
-                    continue
-
-                field_name = plan_field.get("api_name")
-                if not isinstance(field_name, str) or not field_name:
-                    continue
-
-                planned_field_names.add(field_name)
-
-                existing_field = field_map.get(field_name)
-                if existing_field is None:
-                    _append_finding(
-                        findings,
-                        severity="green",
-                        category="field_name",
-                        message=f"{object_name}.{field_name} does not exist - safe to create",
-                    )
-                    continue
-
-                existing_type = str(existing_field.get("type", "")).lower()
-                plan_type = _normalize_type(plan_field.get("type"))
-                if plan_type is None:
-                    plan_type = str(plan_field.get("type", "")).lower()
-
-                if existing_type == plan_type:
-                    _append_finding(
-                        findings,
-                        severity="yellow",
-                        category="field_name",
-                        message=(
-                            f"{object_name}.{field_name} already exists with same type "
-                            f"({existing_type})"
-                        ),
-                    )
-                else:
-                    _append_finding(
-                        findings,
-                        severity="red",
-                        category="field_name",
-                        message=(
-                            f"{object_name}.{field_name} already exists with different type "
-                            f"(existing={existing_type}, requested={plan_type})"
-                        ),
-                    )
-
-            existing_fields = object_payload.get("fields", [])
-            if isinstance(existing_fields, list):
-                for field in existing_fields:
-                    if not isinstance(field, dict):
-                        continue
-                    field_name = field.get("name")
-                    if not isinstance(field_name, str) or not field_name:
-                        continue
-                    if field_name in planned_field_names:
-                        continue
-                    if _is_required_field(field):
-                        _append_finding(
-                            findings,
-                            severity="yellow",
-                            category="required_field",
-                            message=(
-                                f"{object_name} has required field '{field_name}' not in "
-                                "deployment plan"
-                            ),
-                        )
-
-            if _has_active_validation_rules(object_payload):
+        for field_name, field in _named_entries(object_payload.get("fields"), "name"):
+            if field_name in planned_field_names:
+                continue
+            if _is_required_field(field):
                 _append_finding(
                     findings,
                     severity="yellow",
-                    category="validation_rule",
-                    message=f"{object_name} has active validation rules",
+                    category="required_field",
+                    message=(
+                        f"{object_name} has required field '{field_name}' not in "
+                        "deployment plan"
+                    ),
                 )
 
-    green_count = sum(1 for finding in findings if finding["severity"] == "green")
-    yellow_count = sum(1 for finding in findings if finding["severity"] == "yellow")
-    red_count = sum(1 for finding in findings if finding["severity"] == "red")
+        if _has_active_validation_rules(object_payload):
+            _append_finding(
+                findings,
+                severity="yellow",
+                category="validation_rule",
+                message=f"{object_name} has active validation rules",
+            )
+
+    severity_counts = {"green": 0, "yellow": 0, "red": 0}
+    for finding in findings:
+        severity_counts[finding.severity] += 1
+    green_count = severity_counts["green"]
+    yellow_count = severity_counts["yellow"]
+    red_count = severity_counts["red"]
 
     if red_count > 0:
         overall_severity = "red"
@@ -293,7 +252,7 @@ def check_conflicts(deployment_plan: dict, topology_snapshot: dict) -> dict:
         overall_severity = "green"
 
     return {
-        "findings": findings,
+        "findings": [finding.as_dict() for finding in findings],
         "overall_severity": overall_severity,
         "green_count": green_count,
         "yellow_count": yellow_count,
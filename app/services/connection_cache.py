@@ -0,0 +1,72 @@
+import time
+from uuid import UUID
+
+import asyncpg
+
+CONNECTION_TTL_SECONDS = 60.0
+CONNECTION_CACHE_MAXSIZE = 1024
+LAST_USED_TOUCH_INTERVAL_SECONDS = 30.0
+
+_CONNECTED_CONNECTION_SQL = """
+SELECT id, nango_connection_id, nango_provider_config_key
+FROM crm_connections
+WHERE org_id = $1
+  AND client_id = $2
+  AND status = 'connected'
+"""
+
+_TOUCH_LAST_USED_SQL = """
+UPDATE crm_connections
+SET last_used_at = NOW()
+WHERE id = $1
+  AND org_id = $2
+"""
+
+_cache: dict[tuple[str, UUID], tuple[float, asyncpg.Record]] = {}
+_last_touch: dict[tuple[UUID, str], float] = {}
+
+
+async def get_connected_connection(
+    pool, org_id: str, client_id: UUID
+) -> asyncpg.Record | None:
+    """Return the connected crm_connections row for a client, cached for a short TTL.
+
+    Misses are not cached so a freshly connected client is visible immediately.
+    """
+    key = (org_id, client_id)
+    now = time.monotonic()
+    cached = _cache.get(key)
+    if cached is not None:
+        expires_at, row = cached
+        if expires_at > now:
+            return row
+        del _cache[key]
+
+    row = await pool.fetchrow(_CONNECTED_CONNECTION_SQL, org_id, client_id)
+    if row is None:
+        return None
+
+    if len(_cache) >= CONNECTION_CACHE_MAXSIZE:
+        _cache.pop(next(iter(_cache)))
+    _cache[key] = (now + CONNECTION_TTL_SECONDS, row)
+    return row
+
+
+def invalidate_connection(org_id: str, client_id: UUID) -> None:
+    """Drop the cached connection row after crm_connections is mutated."""
+    _cache.pop((org_id, client_id), None)
+
+
+async def touch_last_used(pool, connection_id: UUID, org_id: str) -> None:
+    """Bump last_used_at, skipping the write if this process did so within the interval."""
+    key = (connection_id, org_id)
+    now = time.monotonic()
+    last_touched = _last_touch.get(key)
+    if last_touched is not None and now - last_touched < LAST_USED_TOUCH_INTERVAL_SECONDS:
+        return
+
+    await pool.execute(_TOUCH_LAST_USED_SQL, connection_id, org_id)
+
+    if key not in _last_touch and len(_last_touch) >= CONNECTION_CACHE_MAXSIZE:
+        _last_touch.pop(next(iter(_last_touch)))
+    _last_touch[key] = now
@@ -1,29 +1,74 @@
+import asyncio
 import logging
+import sys
+from collections import Counter
+from collections.abc import Awaitable, Callable
 
 from fastapi import HTTPException
 
 from app.services import metadata_builder, salesforce
 from app.services.deploy_validators import (
+    MAX_REPORTED_VALIDATION_ERRORS,
     validate_analytics_plan,
     validate_custom_object_plan,
     validate_workflow_plan,
+    validation_error_details,
 )
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Salesforce API requests issued by a single deploy or rollback.
+SALESFORCE_CONCURRENCY_LIMIT = 8
+# Names per Tooling SOQL `IN (...)` list, keeping queries well under the SOQL length limit.
+SOQL_IN_CHUNK_SIZE = 200
+
+# Component types backed by a Tooling CustomField record.
+_FIELD_LIKE_TYPES = frozenset({"custom_field", "relationship"})
+
+_FIELD_ID_SOQL = (
+    "SELECT Id FROM CustomField "
+    "WHERE DeveloperName = '{}' AND TableEnumOrId = '{}' "
+    "ORDER BY CreatedDate DESC LIMIT 1"
+)
+_OBJECT_ID_SOQL = "SELECT Id FROM CustomObject WHERE DeveloperName = '{}' ORDER BY CreatedDate DESC LIMIT 1"
+_FIELD_IDS_SOQL = (
+    "SELECT Id, DeveloperName, TableEnumOrId FROM CustomField "
+    "WHERE TableEnumOrId IN ({}) AND DeveloperName IN ({}) "
+    "ORDER BY CreatedDate DESC"
+)
+_OBJECT_IDS_SOQL = "SELECT Id, DeveloperName FROM CustomObject WHERE DeveloperName IN ({}) ORDER BY CreatedDate DESC"
+
+
+def _stripped_str(payload: dict, key: str) -> str:
+    """Return payload[key] as a stripped string, treating missing or falsy values as ""."""
+    value = payload.get(key)
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
+
 
 def _strip_custom_suffix(api_name: str) -> str:
-    return api_name[:-3] if api_name.endswith("__c") else api_name
+    return api_name[:-3] if api_name[-3:] == "__c" else api_name
+
+
+_SOQL_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "'": "\\'"})
 
 
 def _soql_escape(value: str) -> str:
-    return value.replace("\\", "\\\\").replace("'", "\\'")
+    if "'" not in value and "\\" not in value:
+        return value
+    return value.translate(_SOQL_ESCAPE_TABLE)
+
+
+def _soql_in_list(values) -> str:
+    return ", ".join(f"'{_soql_escape(value)}'" for value in values)
 
 
 def _normalize_error(error: object) -> dict:
     if isinstance(error, dict):
+        # The same few Salesforce error codes repeat across every failed component.
         return {
-            "code": str(error.get("code") or error.get("errorCode") or "unknown_error"),
+            "code": sys.intern(str(error.get("code") or error.get("errorCode") or "unknown_error")),
             "message": str(error.get("message") or "Unknown Salesforce error"),
         }
     return {"code": "unknown_error", "message": str(error)}
@@ -36,6 +81,82 @@ def _extract_tooling_error(response: dict) -> dict:
     return {"code": "salesforce_request_failed", "message": "Salesforce request failed"}
 
 
+async def _gather_limited(
+    coroutines: list[Awaitable],
+    limit: int = SALESFORCE_CONCURRENCY_LIMIT,
+) -> list:
+    """Await coroutines concurrently, at most `limit` in flight, returning exceptions in place."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coroutine: Awaitable):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(run(coroutine) for coroutine in coroutines), return_exceptions=True)
+
+
+def _tooling_response_or_error(response: object) -> dict:
+    """Fold an HTTPException captured by _gather_limited into a failed Tooling response."""
+    if isinstance(response, HTTPException):
+        detail = response.detail if isinstance(response.detail, dict) else {"message": str(response.detail)}
+        return {"id": None, "success": False, "errors": [detail]}
+    if isinstance(response, BaseException):
+        raise response
+    return response
+
+
+async def _tooling_composite_batched(
+    items: list,
+    send_batch: Callable[[list], Awaitable[list[dict]]],
+) -> list[dict]:
+    """Send items through Tooling composite requests, one result per item in order."""
+    batch_size = salesforce.TOOLING_COMPOSITE_MAX_SUBREQUESTS
+    batches = [items[offset : offset + batch_size] for offset in range(0, len(items), batch_size)]
+    responses = await _gather_limited([send_batch(batch) for batch in batches])
+
+    results: list[dict] = []
+    for batch, response in zip(batches, responses):
+        if isinstance(response, BaseException):
+            failed = _tooling_response_or_error(response)
+            results.extend(dict(failed) for _ in batch)
+        else:
+            results.extend(response)
+    return results
+
+
+async def _create_fields_batched(
+    nango_connection_id: str,
+    specs: list[dict],
+    provider_config_key: str | None = None,
+) -> list[dict]:
+    """Create CustomFields through Tooling composite requests, one result per spec in order."""
+    return await _tooling_composite_batched(
+        specs,
+        lambda batch: salesforce.tooling_composite_create_fields(
+            nango_connection_id,
+            batch,
+            provider_config_key=provider_config_key,
+        ),
+    )
+
+
+async def _delete_fields_batched(
+    nango_connection_id: str,
+    record_ids: list[str],
+    provider_config_key: str | None = None,
+) -> list[dict]:
+    """Delete CustomFields through Tooling composite requests, one result per ID in order."""
+    return await _tooling_composite_batched(
+        record_ids,
+        lambda batch: salesforce.tooling_composite_delete(
+            nango_connection_id,
+            "CustomField",
+            batch,
+            provider_config_key=provider_config_key,
+        ),
+    )
+
+
 def _derive_relationship_name(field_api_name: str) -> str:
     base = _strip_custom_suffix(field_api_name)
     if base.endswith("_Id"):
@@ -43,91 +164,153 @@ def _derive_relationship_name(field_api_name: str) -> str:
     return base
 
 
+def _picklist_value_from_dict(index: int, value: dict) -> dict:
+    full_name = str(
+        value.get("fullName")
+        or value.get("value")
+        or value.get("label")
+        or f"Value_{index + 1}"
+    )
+    return {
+        "fullName": full_name,
+        "default": bool(value.get("default", index == 0)),
+        "label": str(value.get("label") or full_name),
+        "isActive": bool(value.get("isActive", True)),
+    }
+
+
 def _build_picklist_values(values: list) -> list[dict]:
+    # Plain string values are the common case; build them without per-item type checks.
+    if all(isinstance(value, str) for value in values):
+        return [
+            {"fullName": value, "default": index == 0, "label": value, "isActive": True}
+            for index, value in enumerate(values)
+        ]
+
     normalized: list[dict] = []
     for index, value in enumerate(values):
         if isinstance(value, str):
-            normalized.append(
-                {
-                    "fullName": value,
-                    "default": index == 0,
-                    "label": value,
-                    "isActive": True,
-                }
-            )
-            continue
-        if isinstance(value, dict):
-            full_name = str(
-                value.get("fullName")
-                or value.get("value")
-                or value.get("label")
-                or f"Value_{index + 1}"
-            )
-            normalized.append(
-                {
-                    "fullName": full_name,
-                    "default": bool(value.get("default", index == 0)),
-                    "label": str(value.get("label") or full_name),
-                    "isActive": bool(value.get("isActive", True)),
-                }
-            )
+            normalized.append({"fullName": value, "default": index == 0, "label": value, "isActive": True})
+        elif isinstance(value, dict):
+            normalized.append(_picklist_value_from_dict(index, value))
     return normalized
 
 
-def _build_field_metadata(field: dict) -> dict:
-    field_type = str(field.get("type", "")).strip()
-    label = str(field.get("label") or field.get("api_name") or "Field")
-    metadata: dict = {"type": field_type, "label": label}
-
-    if "required" in field:
-        metadata["required"] = bool(field["required"])
-
-    if field_type == "Text":
-        metadata["length"] = int(field.get("length", 255))
-    elif field_type in {"Number", "Currency", "Percent"}:
-        metadata["precision"] = int(field.get("precision", 18))
-        metadata["scale"] = int(field.get("scale", 2))
-    elif field_type == "Checkbox":
-        metadata["defaultValue"] = bool(field.get("default", field.get("default_value", False)))
-    elif field_type == "Picklist":
-        values = field.get("values") if isinstance(field.get("values"), list) else []
-        metadata["valueSet"] = {
+def _text_field_metadata(field: dict) -> dict:
+    return {"length": int(field.get("length", 255))}
+
+
+def _numeric_field_metadata(field: dict) -> dict:
+    return {
+        "precision": int(field.get("precision", 18)),
+        "scale": int(field.get("scale", 2)),
+    }
+
+
+def _checkbox_field_metadata(field: dict) -> dict:
+    return {"defaultValue": bool(field.get("default", field.get("default_value", False)))}
+
+
+def _picklist_field_metadata(field: dict) -> dict:
+    values = field.get("values") if isinstance(field.get("values"), list) else []
+    return {
+        "valueSet": {
             "restricted": bool(field.get("restricted", True)),
             "valueSetDefinition": {
                 "sorted": bool(field.get("sorted", False)),
                 "value": _build_picklist_values(values),
             },
         }
-    elif field_type == "LongTextArea":
-        metadata["length"] = int(field.get("length", 32768))
-        metadata["visibleLines"] = int(field.get("visible_lines", field.get("visibleLines", 3)))
-    elif field_type == "Lookup":
-        metadata["referenceTo"] = str(field.get("related_to") or field.get("referenceTo") or "")
-        metadata["relationshipName"] = str(
-            field.get("relationship_name")
-            or field.get("relationshipName")
-            or _derive_relationship_name(str(field.get("api_name", "")))
-        )
-        metadata["deleteConstraint"] = str(field.get("delete_constraint") or field.get("deleteConstraint") or "SetNull")
-    elif field_type == "MasterDetail":
-        metadata["referenceTo"] = str(field.get("related_to") or field.get("referenceTo") or "")
-        metadata["relationshipName"] = str(
+    }
+
+
+def _long_text_area_field_metadata(field: dict) -> dict:
+    return {
+        "length": int(field.get("length", 32768)),
+        "visibleLines": int(field.get("visible_lines", field.get("visibleLines", 3))),
+    }
+
+
+def _relationship_field_metadata(field: dict) -> dict:
+    return {
+        "referenceTo": str(field.get("related_to") or field.get("referenceTo") or ""),
+        "relationshipName": str(
             field.get("relationship_name")
             or field.get("relationshipName")
             or _derive_relationship_name(str(field.get("api_name", "")))
-        )
+        ),
+    }
 
+
+def _lookup_field_metadata(field: dict) -> dict:
+    metadata = _relationship_field_metadata(field)
+    metadata["deleteConstraint"] = str(field.get("delete_constraint") or field.get("deleteConstraint") or "SetNull")
     return metadata
 
 
+_FIELD_BUILDERS: dict[str, Callable[[dict], dict]] = {
+    "Text": _text_field_metadata,
+    "Number": _numeric_field_metadata,
+    "Currency": _numeric_field_metadata,
+    "Percent": _numeric_field_metadata,
+    "Checkbox": _checkbox_field_metadata,
+    "Picklist": _picklist_field_metadata,
+    "LongTextArea": _long_text_area_field_metadata,
+    "Lookup": _lookup_field_metadata,
+    "MasterDetail": _relationship_field_metadata,
+}
+
+
+def _build_field_metadata(field: dict) -> dict:
+    field_type = str(field.get("type", "")).strip()
+    builder = _FIELD_BUILDERS.get(field_type)
+    return {
+        "type": field_type,
+        "label": str(field.get("label") or field.get("api_name") or "Field"),
+        **({"required": bool(field["required"])} if "required" in field else {}),
+        **(builder(field) if builder is not None else {}),
+    }
+
+
 def _resolve_deployment_status(total: int, succeeded: int) -> str:
-    if total == 0 or succeeded == 0:
+    if total == 0:
+        return "noop"
+    if succeeded == 0:
         return "failed"
     if succeeded == total:
         return "succeeded"
     return "partial"
 
 
+# Pre-built responses for calls with nothing to deploy; callers copy them with a fresh
+# components list so the constants are never aliased.
+_EMPTY_WORKFLOW_DEPLOY_RESPONSE = {
+    "status": _resolve_deployment_status(0, 0),
+    "flows_deployed": 0,
+    "assignment_rules_deployed": 0,
+    "components": [],
+}
+_EMPTY_WORKFLOW_REMOVAL_RESPONSE = {
+    "status": _resolve_deployment_status(0, 0),
+    "flows_removed": 0,
+    "assignment_rules_removed": 0,
+    "components": [],
+}
+_EMPTY_ANALYTICS_DEPLOY_RESPONSE = {
+    "status": _resolve_deployment_status(0, 0),
+    "reports_deployed": 0,
+    "dashboards_deployed": 0,
+    "folders_created": 0,
+    "components": [],
+}
+_EMPTY_ANALYTICS_ROLLBACK_RESPONSE = {
+    "status": _resolve_deployment_status(0, 0),
+    "components": [],
+    "rolled_back_components": 0,
+    "failed_components": 0,
+}
+
+
 def _as_dict_list(value: object) -> list[dict]:
     if isinstance(value, list):
         return [item for item in value if isinstance(item, dict)]
@@ -136,38 +319,30 @@ def _as_dict_list(value: object) -> list[dict]:
     return []
 
 
-def _metadata_status(metadata_result: dict) -> str:
-    deploy_result = metadata_result.get("deployResult")
-    if isinstance(deploy_result, dict):
-        status = deploy_result.get("status")
-        if status:
-            return str(status)
-    status = metadata_result.get("status")
-    return str(status) if status else "Unknown"
+def _metadata_component_map(entries: object) -> dict[str, dict]:
+    component_map: dict[str, dict] = {}
+    for component in _as_dict_list(entries):
+        full_name = _stripped_str(component, "fullName")
+        if full_name:
+            # Interned so lookups with interned planned names hit dict's identity check.
+            component_map[sys.intern(full_name)] = component
+    return component_map
 
 
-def _metadata_component_maps(metadata_result: dict) -> tuple[dict[str, dict], dict[str, dict]]:
+def _parse_metadata_result(metadata_result: dict) -> tuple[str, dict[str, dict], dict[str, dict]]:
+    """Read a deploy result's status and its success/failure maps keyed by fullName."""
     deploy_result = metadata_result.get("deployResult")
     if not isinstance(deploy_result, dict):
-        return {}, {}
+        deploy_result = {}
+    status = deploy_result.get("status") or metadata_result.get("status")
     details = deploy_result.get("details")
     if not isinstance(details, dict):
-        return {}, {}
-
-    success_map: dict[str, dict] = {}
-    failure_map: dict[str, dict] = {}
-
-    for component in _as_dict_list(details.get("componentSuccesses")):
-        full_name = str(component.get("fullName") or "").strip()
-        if full_name:
-            success_map[full_name] = component
-
-    for component in _as_dict_list(details.get("componentFailures")):
-        full_name = str(component.get("fullName") or "").strip()
-        if full_name:
-            failure_map[full_name] = component
-
-    return success_map, failure_map
+        details = {}
+    return (
+        str(status) if status else "Unknown",
+        _metadata_component_map(details.get("componentSuccesses")),
+        _metadata_component_map(details.get("componentFailures")),
+    )
 
 
 def _metadata_failure_to_error(failure: dict) -> dict:
@@ -181,18 +356,79 @@ def _metadata_failure_to_error(failure: dict) -> dict:
     return {"code": code, "message": message}
 
 
-def _metadata_failure_component(
-    component_type: str,
-    api_name: str,
+def _metadata_failure_error(detail: object) -> dict:
+    return _normalize_error(detail if isinstance(detail, dict) else {"message": str(detail)})
+
+
+def _metadata_failure_components(
+    planned_components: list[tuple[str, str]],
     detail: object,
-) -> dict:
-    error = _normalize_error(detail if isinstance(detail, dict) else {"message": str(detail)})
-    return {
-        "type": component_type,
-        "api_name": api_name,
-        "success": False,
-        "error": error,
-    }
+) -> list[dict]:
+    """Fail every planned component with one error; the error dict is shared across results."""
+    error = _metadata_failure_error(detail)
+    return [
+        {"type": component_type, "api_name": api_name, "success": False, "error": error}
+        for component_type, api_name in planned_components
+    ]
+
+
+_EMPTY_COMPONENT: dict = {}
+
+
+def _dedupe_planned_components(
+    planned_components: list[tuple[str, str]],
+    plan_label: str,
+) -> list[tuple[str, str]]:
+    unique_components = list(dict.fromkeys(planned_components))
+    duplicate_count = len(planned_components) - len(unique_components)
+    if duplicate_count:
+        logger.warning("%s plan lists %d duplicate components", plan_label, duplicate_count)
+    return unique_components
+
+
+def _materialize_component_results(
+    planned_components: list[tuple[str, str]],
+    metadata_result: dict,
+    deploy_label: str = "Metadata deploy",
+) -> tuple[list[dict], dict[str, int]]:
+    """Turn a Metadata deploy result into per-component results and success counts per type."""
+    deploy_status, success_map, failure_map = _parse_metadata_result(metadata_result)
+    deploy_succeeded = deploy_status == "Succeeded"
+    get_success = success_map.get
+    get_failure = failure_map.get
+    intern = sys.intern
+
+    results: list[dict] = []
+    counts: dict[str, int] = {}
+    for component_type, api_name in planned_components:
+        api_name = intern(api_name)
+        failed_component = get_failure(api_name)
+        successful_component = get_success(api_name) or _EMPTY_COMPONENT
+        success = not failed_component and (bool(successful_component) or deploy_succeeded)
+        sfdc_id = successful_component.get("id") or successful_component.get("componentId")
+        if success:
+            counts[component_type] = counts.get(component_type, 0) + 1
+            results.append(
+                {"type": component_type, "api_name": api_name, "success": True, "sfdc_id": sfdc_id}
+            )
+            continue
+        results.append(
+            {
+                "type": component_type,
+                "api_name": api_name,
+                "success": False,
+                "sfdc_id": sfdc_id,
+                "error": (
+                    _metadata_failure_to_error(failed_component)
+                    if failed_component
+                    else {
+                        "code": "metadata_deploy_failed",
+                        "message": f"{deploy_label} ended with status {deploy_status}",
+                    }
+                ),
+            }
+        )
+    return results, counts
 
 
 def _workflow_metadata_components(
@@ -212,7 +448,7 @@ def _workflow_metadata_components(
     for flow in raw_flows:
         if not isinstance(flow, dict):
             continue
-        flow_api_name = str(flow.get("api_name") or "").strip()
+        flow_api_name = _stripped_str(flow, "api_name")
         if not flow_api_name:
             components.append(
                 {
@@ -260,19 +496,26 @@ async def execute_workflow_deployment(
     nango_connection_id: str,
     plan: dict,
     provider_config_key: str | None = None,
+    *,
+    validated: bool = False,
 ) -> dict:
-    validation_errors = validate_workflow_plan(plan)
-    if validation_errors:
-        raise HTTPException(
-            status_code=400,
-            detail={"code": "invalid_deploy_plan", "errors": validation_errors},
-        )
+    # Callers that already ran validate_workflow_plan on this plan (the background
+    # workflow deploy) pass validated=True so it is not validated twice.
+    if not validated:
+        validation_errors = validate_workflow_plan(plan, max_errors=MAX_REPORTED_VALIDATION_ERRORS)
+        if validation_errors:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "invalid_deploy_plan", "errors": validation_error_details(validation_errors)},
+            )
 
     components, valid_flows, valid_assignment_rules = _workflow_metadata_components(plan)
+    if not (valid_flows or valid_assignment_rules) and not components:
+        return {**_EMPTY_WORKFLOW_DEPLOY_RESPONSE, "components": []}
 
     planned_components: list[tuple[str, str]] = []
     for flow in valid_flows:
-        planned_components.append(("flow", str(flow.get("api_name")).strip()))
+        planned_components.append(("flow", _stripped_str(flow, "api_name")))
     for assignment_rule in valid_assignment_rules:
         object_name = str(
             assignment_rule.get("object")
@@ -281,6 +524,7 @@ async def execute_workflow_deployment(
             or ""
         ).strip()
         planned_components.append(("assignment_rule", object_name))
+    planned_components = _dedupe_planned_components(planned_components, "Workflow")
 
     flows_deployed = 0
     assignment_rules_deployed = 0
@@ -296,54 +540,17 @@ async def execute_workflow_deployment(
                 zip_bytes=zip_bytes,
                 provider_config_key=provider_config_key,
             )
-            deploy_status = _metadata_status(metadata_result)
-            success_map, failure_map = _metadata_component_maps(metadata_result)
-
-            for component_type, api_name in planned_components:
-                failed_component = failure_map.get(api_name)
-                successful_component = success_map.get(api_name)
-                success = bool(successful_component) and not bool(failed_component)
-                if not success and not failed_component and deploy_status == "Succeeded":
-                    success = True
-
-                component_result: dict = {
-                    "type": component_type,
-                    "api_name": api_name,
-                    "success": success,
-                    "sfdc_id": (
-                        (successful_component or {}).get("id")
-                        or (successful_component or {}).get("componentId")
-                    ),
-                }
-                if not success:
-                    if failed_component:
-                        component_result["error"] = _metadata_failure_to_error(failed_component)
-                    else:
-                        component_result["error"] = {
-                            "code": "metadata_deploy_failed",
-                            "message": f"Metadata deploy ended with status {deploy_status}",
-                        }
-                else:
-                    if component_type == "flow":
-                        flows_deployed += 1
-                    elif component_type == "assignment_rule":
-                        assignment_rules_deployed += 1
-
-                components.append(component_result)
+            results, counts = _materialize_component_results(planned_components, metadata_result)
+            components.extend(results)
+            flows_deployed = counts.get("flow", 0)
+            assignment_rules_deployed = counts.get("assignment_rule", 0)
         except HTTPException as exc:
-            for component_type, api_name in planned_components:
-                components.append(
-                    _metadata_failure_component(
-                        component_type=component_type,
-                        api_name=api_name,
-                        detail=exc.detail,
-                    )
-                )
+            components.extend(_metadata_failure_components(planned_components, exc.detail))
 
-    total_components = len(components)
-    successful_components = sum(1 for component in components if component.get("success"))
+    # Invalid-plan components always fail, so the per-type counters are the success total.
+    successful_components = flows_deployed + assignment_rules_deployed
     return {
-        "status": _resolve_deployment_status(total_components, successful_components),
+        "status": _resolve_deployment_status(len(components), successful_components),
         "flows_deployed": flows_deployed,
         "assignment_rules_deployed": assignment_rules_deployed,
         "components": components,
@@ -364,213 +571,107 @@ async def execute_workflow_removal(
     planned_components: list[tuple[str, str]] = []
     planned_components.extend(("flow", name) for name in normalized_flow_names)
     planned_components.extend(("assignment_rule", name) for name in normalized_assignment_objects)
+    planned_components = _dedupe_planned_components(planned_components, "Workflow removal")
+    if not planned_components:
+        return {**_EMPTY_WORKFLOW_REMOVAL_RESPONSE, "components": []}
 
     components: list[dict] = []
     flows_removed = 0
     assignment_rules_removed = 0
 
-    if planned_components:
-        try:
-            zip_bytes = metadata_builder.build_workflow_destructive_deploy_zip(
-                flow_api_names=normalized_flow_names,
-                assignment_rule_objects=normalized_assignment_objects,
-            )
-            metadata_result = await salesforce.metadata_deploy_and_poll(
-                nango_connection_id=nango_connection_id,
-                zip_bytes=zip_bytes,
-                provider_config_key=provider_config_key,
-            )
-            deploy_status = _metadata_status(metadata_result)
-            success_map, failure_map = _metadata_component_maps(metadata_result)
-
-            for component_type, api_name in planned_components:
-                failed_component = failure_map.get(api_name)
-                successful_component = success_map.get(api_name)
-                success = bool(successful_component) and not bool(failed_component)
-                if not success and not failed_component and deploy_status == "Succeeded":
-                    success = True
-
-                component_result: dict = {
-                    "type": component_type,
-                    "api_name": api_name,
-                    "success": success,
-                    "sfdc_id": (
-                        (successful_component or {}).get("id")
-                        or (successful_component or {}).get("componentId")
-                    ),
-                }
-                if not success:
-                    if failed_component:
-                        component_result["error"] = _metadata_failure_to_error(failed_component)
-                    else:
-                        component_result["error"] = {
-                            "code": "metadata_deploy_failed",
-                            "message": f"Destructive deploy ended with status {deploy_status}",
-                        }
-                else:
-                    if component_type == "flow":
-                        flows_removed += 1
-                    elif component_type == "assignment_rule":
-                        assignment_rules_removed += 1
-
-                components.append(component_result)
-        except HTTPException as exc:
-            for component_type, api_name in planned_components:
-                components.append(
-                    _metadata_failure_component(
-                        component_type=component_type,
-                        api_name=api_name,
-                        detail=exc.detail,
-                    )
-                )
+    try:
+        zip_bytes = metadata_builder.build_workflow_destructive_deploy_zip(
+            flow_api_names=normalized_flow_names,
+            assignment_rule_objects=normalized_assignment_objects,
+        )
+        metadata_result = await salesforce.metadata_deploy_and_poll(
+            nango_connection_id=nango_connection_id,
+            zip_bytes=zip_bytes,
+            provider_config_key=provider_config_key,
+        )
+        results, counts = _materialize_component_results(
+            planned_components,
+            metadata_result,
+            deploy_label="Destructive deploy",
+        )
+        components.extend(results)
+        flows_removed = counts.get("flow", 0)
+        assignment_rules_removed = counts.get("assignment_rule", 0)
+    except HTTPException as exc:
+        components.extend(_metadata_failure_components(planned_components, exc.detail))
 
-    total_components = len(components)
-    successful_components = sum(1 for component in components if component.get("success"))
+    successful_components = flows_removed + assignment_rules_removed
     return {
-        "status": _resolve_deployment_status(total_components, successful_components),
+        "status": _resolve_deployment_status(len(components), successful_components),
         "flows_removed": flows_removed,
         "assignment_rules_removed": assignment_rules_removed,
         "components": components,
     }
 
 
+def _planned_analytics_components(
+    entries: list[dict] | None,
+    component_type: str,
+    *,
+    in_folder: bool = False,
+) -> list[tuple[str, str]]:
+    """Plan one validated analytics section, naming foldered entries `Folder/ApiName` like Metadata API does."""
+    if not entries:
+        return []
+    if in_folder:
+        return [
+            (component_type, f"{entry['folder'].strip()}/{entry['api_name'].strip()}") for entry in entries
+        ]
+    return [(component_type, entry["api_name"].strip()) for entry in entries]
+
+
 async def execute_analytics_deployment(
     nango_connection_id: str,
     plan: dict,
     provider_config_key: str | None = None,
 ) -> dict:
-    validation_errors = validate_analytics_plan(plan)
+    validation_errors = validate_analytics_plan(plan, max_errors=MAX_REPORTED_VALIDATION_ERRORS)
     if validation_errors:
         raise HTTPException(
             status_code=400,
-            detail={"code": "invalid_deploy_plan", "errors": validation_errors},
+            detail={"code": "invalid_deploy_plan", "errors": validation_error_details(validation_errors)},
         )
 
-    report_folders_raw = plan.get("report_folders")
-    if not isinstance(report_folders_raw, list):
-        report_folders_raw = []
-    dashboard_folders_raw = plan.get("dashboard_folders")
-    if not isinstance(dashboard_folders_raw, list):
-        dashboard_folders_raw = []
-    reports_raw = plan.get("reports")
-    if not isinstance(reports_raw, list):
-        reports_raw = []
-    dashboards_raw = plan.get("dashboards")
-    if not isinstance(dashboards_raw, list):
-        dashboards_raw = []
-
-    report_folders = [
-        folder
-        for folder in report_folders_raw
-        if isinstance(folder, dict) and str(folder.get("api_name") or "").strip()
-    ]
-    dashboard_folders = [
-        folder
-        for folder in dashboard_folders_raw
-        if isinstance(folder, dict) and str(folder.get("api_name") or "").strip()
+    # validate_analytics_plan guarantees every section is a list of dicts with non-empty
+    # api_name (and folder, for reports and dashboards) strings.
+    planned_components: list[tuple[str, str]] = [
+        *_planned_analytics_components(plan.get("report_folders"), "report_folder"),
+        *_planned_analytics_components(plan.get("dashboard_folders"), "dashboard_folder"),
+        *_planned_analytics_components(plan.get("reports"), "report", in_folder=True),
+        *_planned_analytics_components(plan.get("dashboards"), "dashboard", in_folder=True),
     ]
-    reports = [
-        report
-        for report in reports_raw
-        if isinstance(report, dict)
-        and str(report.get("api_name") or "").strip()
-        and str(report.get("folder") or "").strip()
-    ]
-    dashboards = [
-        dashboard
-        for dashboard in dashboards_raw
-        if isinstance(dashboard, dict)
-        and str(dashboard.get("api_name") or "").strip()
-        and str(dashboard.get("folder") or "").strip()
-    ]
-
-    planned_components: list[tuple[str, str]] = []
-    planned_components.extend(
-        ("report_folder", str(folder.get("api_name") or "").strip())
-        for folder in report_folders
-    )
-    planned_components.extend(
-        ("dashboard_folder", str(folder.get("api_name") or "").strip())
-        for folder in dashboard_folders
-    )
-    planned_components.extend(
-        (
-            "report",
-            f"{str(report.get('folder') or '').strip()}/{str(report.get('api_name') or '').strip()}",
-        )
-        for report in reports
-    )
-    planned_components.extend(
-        (
-            "dashboard",
-            f"{str(dashboard.get('folder') or '').strip()}/{str(dashboard.get('api_name') or '').strip()}",
-        )
-        for dashboard in dashboards
-    )
+    planned_components = _dedupe_planned_components(planned_components, "Analytics")
+    if not planned_components:
+        return {**_EMPTY_ANALYTICS_DEPLOY_RESPONSE, "components": []}
 
     components: list[dict] = []
     reports_deployed = 0
     dashboards_deployed = 0
     folders_created = 0
 
-    if planned_components:
-        try:
-            zip_bytes = metadata_builder.build_analytics_deploy_zip(plan)
-            metadata_result = await salesforce.metadata_deploy_and_poll(
-                nango_connection_id=nango_connection_id,
-                zip_bytes=zip_bytes,
-                provider_config_key=provider_config_key,
-            )
-            deploy_status = _metadata_status(metadata_result)
-            success_map, failure_map = _metadata_component_maps(metadata_result)
-
-            for component_type, full_name in planned_components:
-                failed_component = failure_map.get(full_name)
-                successful_component = success_map.get(full_name)
-                success = bool(successful_component) and not bool(failed_component)
-                if not success and not failed_component and deploy_status == "Succeeded":
-                    success = True
-
-                component_result: dict = {
-                    "type": component_type,
-                    "api_name": full_name,
-                    "success": success,
-                    "sfdc_id": (
-                        (successful_component or {}).get("id")
-                        or (successful_component or {}).get("componentId")
-                    ),
-                }
-                if not success:
-                    if failed_component:
-                        component_result["error"] = _metadata_failure_to_error(failed_component)
-                    else:
-                        component_result["error"] = {
-                            "code": "metadata_deploy_failed",
-                            "message": f"Metadata deploy ended with status {deploy_status}",
-                        }
-                else:
-                    if component_type == "report":
-                        reports_deployed += 1
-                    elif component_type == "dashboard":
-                        dashboards_deployed += 1
-                    elif component_type in {"report_folder", "dashboard_folder"}:
-                        folders_created += 1
-
-                components.append(component_result)
-        except HTTPException as exc:
-            for component_type, full_name in planned_components:
-                components.append(
-                    _metadata_failure_component(
-                        component_type=component_type,
-                        api_name=full_name,
-                        detail=exc.detail,
-                    )
-                )
+    try:
+        zip_bytes = metadata_builder.build_analytics_deploy_zip(plan)
+        metadata_result = await salesforce.metadata_deploy_and_poll(
+            nango_connection_id=nango_connection_id,
+            zip_bytes=zip_bytes,
+            provider_config_key=provider_config_key,
+        )
+        results, counts = _materialize_component_results(planned_components, metadata_result)
+        components.extend(results)
+        reports_deployed = counts.get("report", 0)
+        dashboards_deployed = counts.get("dashboard", 0)
+        folders_created = counts.get("report_folder", 0) + counts.get("dashboard_folder", 0)
+    except HTTPException as exc:
+        components.extend(_metadata_failure_components(planned_components, exc.detail))
 
-    total_components = len(components)
-    successful_components = sum(1 for component in components if component.get("success"))
+    successful_components = reports_deployed + dashboards_deployed + folders_created
     return {
-        "status": _resolve_deployment_status(total_components, successful_components),
+        "status": _resolve_deployment_status(len(components), successful_components),
         "reports_deployed": reports_deployed,
         "dashboards_deployed": dashboards_deployed,
         "folders_created": folders_created,
@@ -587,105 +688,60 @@ async def execute_analytics_rollback(
     if not isinstance(components, list):
         components = []
 
-    successful_components = [
-        component
-        for component in components
-        if isinstance(component, dict) and bool(component.get("success"))
-    ]
+    # Ordered, de-duplicated names per analytics type, collected in one pass.
+    names_by_type: dict[str, dict[str, None]] = {
+        "dashboard": {},
+        "report": {},
+        "dashboard_folder": {},
+        "report_folder": {},
+    }
+    for component in components:
+        if not isinstance(component, dict) or not component.get("success"):
+            continue
+        names = names_by_type.get(str(component.get("type") or ""))
+        if names is None:
+            continue
+        full_name = _stripped_str(component, "api_name")
+        if full_name:
+            names[full_name] = None
 
-    dashboards = list(
-        dict.fromkeys(
-            str(component.get("api_name") or "").strip()
-            for component in successful_components
-            if str(component.get("type") or "") == "dashboard"
-            and str(component.get("api_name") or "").strip()
-        )
-    )
-    reports = list(
-        dict.fromkeys(
-            str(component.get("api_name") or "").strip()
-            for component in successful_components
-            if str(component.get("type") or "") == "report"
-            and str(component.get("api_name") or "").strip()
-        )
-    )
-    dashboard_folders = list(
-        dict.fromkeys(
-            str(component.get("api_name") or "").strip()
-            for component in successful_components
-            if str(component.get("type") or "") == "dashboard_folder"
-            and str(component.get("api_name") or "").strip()
-        )
-    )
-    report_folders = list(
-        dict.fromkeys(
-            str(component.get("api_name") or "").strip()
-            for component in successful_components
-            if str(component.get("type") or "") == "report_folder"
-            and str(component.get("api_name") or "").strip()
-        )
-    )
+    dashboards = list(names_by_type["dashboard"])
+    reports = list(names_by_type["report"])
+    dashboard_folders = list(names_by_type["dashboard_folder"])
+    report_folders = list(names_by_type["report_folder"])
 
     planned_components: list[tuple[str, str]] = []
     planned_components.extend(("dashboard", full_name) for full_name in dashboards)
     planned_components.extend(("report", full_name) for full_name in reports)
     planned_components.extend(("dashboard_folder", full_name) for full_name in dashboard_folders)
     planned_components.extend(("report_folder", full_name) for full_name in report_folders)
+    if not planned_components:
+        return {**_EMPTY_ANALYTICS_ROLLBACK_RESPONSE, "components": []}
 
     rollback_components: list[dict] = []
-    if planned_components:
-        try:
-            zip_bytes = metadata_builder.build_analytics_destructive_deploy_zip(
-                report_folders=report_folders,
-                dashboard_folders=dashboard_folders,
-                reports=reports,
-                dashboards=dashboards,
-            )
-            metadata_result = await salesforce.metadata_deploy_and_poll(
-                nango_connection_id=nango_connection_id,
-                zip_bytes=zip_bytes,
-                provider_config_key=provider_config_key,
-            )
-            deploy_status = _metadata_status(metadata_result)
-            success_map, failure_map = _metadata_component_maps(metadata_result)
-
-            for component_type, full_name in planned_components:
-                failed_component = failure_map.get(full_name)
-                successful_component = success_map.get(full_name)
-                success = bool(successful_component) and not bool(failed_component)
-                if not success and not failed_component and deploy_status == "Succeeded":
-                    success = True
-
-                rollback_result: dict = {
-                    "type": component_type,
-                    "api_name": full_name,
-                    "success": success,
-                    "sfdc_id": (
-                        (successful_component or {}).get("id")
-                        or (successful_component or {}).get("componentId")
-                    ),
-                }
-                if not success:
-                    if failed_component:
-                        rollback_result["error"] = _metadata_failure_to_error(failed_component)
-                    else:
-                        rollback_result["error"] = {
-                            "code": "metadata_deploy_failed",
-                            "message": f"Destructive deploy ended with status {deploy_status}",
-                        }
-                rollback_components.append(rollback_result)
-        except HTTPException as exc:
-            for component_type, full_name in planned_components:
-                rollback_components.append(
-                    _metadata_failure_component(
-                        component_type=component_type,
-                        api_name=full_name,
-                        detail=exc.detail,
-                    )
-                )
+    successful_count = 0
+    try:
+        zip_bytes = metadata_builder.build_analytics_destructive_deploy_zip(
+            report_folders=report_folders,
+            dashboard_folders=dashboard_folders,
+            reports=reports,
+            dashboards=dashboards,
+        )
+        metadata_result = await salesforce.metadata_deploy_and_poll(
+            nango_connection_id=nango_connection_id,
+            zip_bytes=zip_bytes,
+            provider_config_key=provider_config_key,
+        )
+        rollback_components, counts = _materialize_component_results(
+            planned_components,
+            metadata_result,
+            deploy_label="Destructive deploy",
+        )
+        successful_count = sum(counts.values())
+    except HTTPException as exc:
+        rollback_components.extend(_metadata_failure_components(planned_components, exc.detail))
 
     total_components = len(rollback_components)
-    successful_count = sum(1 for component in rollback_components if component.get("success"))
     return {
         "status": _resolve_deployment_status(total_components, successful_count),
         "components": rollback_components,
@@ -694,6 +750,26 @@ async def execute_analytics_rollback(
     }
 
 
+_AUTO_MAP_UPSERT_SQL = """
+INSERT INTO crm_field_mappings (
+    org_id,
+    client_id,
+    canonical_object,
+    sfdc_object,
+    field_mappings,
+    external_id_field,
+    is_active
+)
+VALUES ($1, $2, $3, $4, $5::jsonb, NULL, TRUE)
+ON CONFLICT (org_id, client_id, canonical_object)
+DO UPDATE SET
+    sfdc_object = EXCLUDED.sfdc_object,
+    -- Existing DB mappings on right side win on key conflict — preserves human-defined mappings over auto-generated identity mappings.
+    field_mappings = EXCLUDED.field_mappings || crm_field_mappings.field_mappings,
+    is_active = TRUE
+"""
+
+
 async def _best_effort_auto_map_custom_objects(
     *,
     pool,
@@ -709,7 +785,7 @@ async def _best_effort_auto_map_custom_objects(
             continue
 
         component_type = str(component.get("type") or "")
-        api_name = str(component.get("api_name") or "").strip()
+        api_name = _stripped_str(component, "api_name")
         if not api_name:
             continue
 
@@ -718,270 +794,187 @@ async def _best_effort_auto_map_custom_objects(
             object_to_fields.setdefault(api_name, set())
             continue
 
-        if component_type in {"custom_field", "relationship"} and "." in api_name:
+        if component_type in _FIELD_LIKE_TYPES and "." in api_name:
             object_api_name, field_api_name = api_name.split(".", 1)
             if object_api_name in successful_objects and field_api_name:
                 object_to_fields.setdefault(object_api_name, set()).add(field_api_name)
 
-    for object_api_name in successful_objects:
-        field_names = sorted(object_to_fields.get(object_api_name, set()))
-        identity_mapping = {field_name: field_name for field_name in field_names}
-        await pool.execute(
-            """
-            INSERT INTO crm_field_mappings (
+    if not successful_objects:
+        return
+
+    # One prepared statement, pipelined across every deployed object.
+    await pool.executemany(
+        _AUTO_MAP_UPSERT_SQL,
+        [
+            (
                 org_id,
                 client_id,
-                canonical_object,
-                sfdc_object,
-                field_mappings,
-                external_id_field,
-                is_active
+                object_api_name,
+                object_api_name,
+                {field_name: field_name for field_name in sorted(object_to_fields.get(object_api_name, set()))},
             )
-            VALUES ($1, $2, $3, $4, $5::jsonb, NULL, TRUE)
-            ON CONFLICT (org_id, client_id, canonical_object)
-            DO UPDATE SET
-                sfdc_object = EXCLUDED.sfdc_object,
-                -- Existing DB mappings on right side win on key conflict — preserves human-defined mappings over auto-generated identity mappings.
-                field_mappings = EXCLUDED.field_mappings || crm_field_mappings.field_mappings,
-                is_active = TRUE
-            """,
-            org_id,
-            client_id,
-            object_api_name,
-            object_api_name,
-            identity_mapping,
-        )
+            for object_api_name in sorted(successful_objects)
+        ],
+    )
 
 
-async def execute_deployment(
+async def _deploy_custom_objects(
     nango_connection_id: str,
-    plan: dict,
+    metadata_custom_objects: list[dict],
+    planned_custom_components: list[tuple[str, str]],
+    planned_field_specs: dict[str, dict],
     *,
     pool,
     org_id: str,
     client_id,
     provider_config_key: str | None = None,
-) -> dict:
-    validation_errors = validate_custom_object_plan(plan)
-    if validation_errors:
-        raise HTTPException(
-            status_code=400,
-            detail={"code": "invalid_deploy_plan", "errors": validation_errors},
+) -> list[dict]:
+    """Deploy custom objects via the Metadata API and verify their fields, in plan order."""
+    try:
+        zip_bytes = metadata_builder.build_custom_object_zip(metadata_custom_objects)
+        metadata_result = await salesforce.metadata_deploy_and_poll(
+            nango_connection_id=nango_connection_id,
+            zip_bytes=zip_bytes,
+            provider_config_key=provider_config_key,
         )
+        custom_results, _ = _materialize_component_results(planned_custom_components, metadata_result)
+        # A componentSuccesses entry carries the field's ID, which is authoritative. Metadata
+        # deploy can also report "Succeeded" without per-field successes; verify those
+        # fields exist in bulk and backfill the missing ones via Tooling API.
+        unverified_fields = [
+            component_result
+            for component_result in custom_results
+            if component_result["success"]
+            and not component_result["sfdc_id"]
+            and component_result["type"] in _FIELD_LIKE_TYPES
+        ]
 
-    components: list[dict] = []
-    objects_created = 0
-    fields_created = 0
-    relationships_created = 0
-
-    custom_objects = plan.get("custom_objects")
-    if not isinstance(custom_objects, list):
-        custom_objects = []
+        resolved_field_ids = await _resolve_field_ids(
+            nango_connection_id,
+            [component_result["api_name"] for component_result in unverified_fields],
+            provider_config_key=provider_config_key,
+        )
+        backfill_components: list[dict] = []
+        backfill_creates: list[dict] = []
+        for component_result in unverified_fields:
+            api_name = component_result["api_name"]
+            resolved_field_id = resolved_field_ids.get(api_name)
+            if resolved_field_id:
+                component_result["sfdc_id"] = resolved_field_id
+                continue
+            field_spec = planned_field_specs.get(api_name)
+            if not field_spec:
+                component_result["success"] = False
+                component_result["error"] = {
+                    "code": "field_verification_failed",
+                    "message": f"Could not verify or create field {api_name}",
+                }
+                continue
+            backfill_components.append(component_result)
+            # Composite creates only serialize the spec, so the planned one is passed as-is.
+            backfill_creates.append(field_spec)
 
-    metadata_custom_objects: list[dict] = []
-    for custom_object in custom_objects:
-        if not isinstance(custom_object, dict):
-            continue
+        create_responses = await _create_fields_batched(
+            nango_connection_id,
+            backfill_creates,
+            provider_config_key=provider_config_key,
+        )
+        for component_result, create_response in zip(backfill_components, create_responses):
+            create_success = bool(create_response.get("success"))
+            component_result["success"] = create_success
+            component_result["sfdc_id"] = create_response.get("id")
+            if not create_success:
+                component_result["error"] = _extract_tooling_error(create_response)
 
-        object_api_name = str(custom_object.get("api_name") or "").strip()
-        if not object_api_name:
-            components.append(
-                {
-                    "type": "custom_object",
-                    "api_name": "",
-                    "success": False,
-                    "error": {
-                        "code": "invalid_plan",
-                        "message": "Custom object entry is missing api_name",
-                    },
-                }
+        try:
+            await _best_effort_auto_map_custom_objects(
+                pool=pool,
+                org_id=org_id,
+                client_id=client_id,
+                components=custom_results,
             )
-            continue
+        except Exception:
+            logger.exception(
+                "Auto-mapping upsert failed after deployment",
+                extra={
+                    "org_id": org_id,
+                    "client_id": str(client_id),
+                },
+            )
+    except HTTPException as exc:
+        return _metadata_failure_components(planned_custom_components, exc.detail)
 
-        metadata_custom_objects.append(custom_object)
-
-    if metadata_custom_objects:
-        planned_custom_components: list[tuple[str, str]] = []
-        planned_field_specs: dict[str, dict] = {}
-        for custom_object in metadata_custom_objects:
-            object_api_name = str(custom_object.get("api_name") or "").strip()
-            planned_custom_components.append(("custom_object", object_api_name))
-
-            fields = custom_object.get("fields")
-            if isinstance(fields, list):
-                for field in fields:
-                    if not isinstance(field, dict):
-                        continue
-                    field_api_name = str(field.get("api_name") or "").strip()
-                    if not field_api_name:
-                        components.append(
-                            {
-                                "type": "custom_field",
-                                "api_name": f"{object_api_name}.",
-                                "success": False,
-                                "error": {
-                                    "code": "invalid_plan",
-                                    "message": f"Field entry for {object_api_name} is missing api_name",
-                                },
-                            }
-                        )
-                        continue
-                    full_name = f"{object_api_name}.{field_api_name}"
-                    planned_custom_components.append(
-                        ("custom_field", full_name)
-                    )
-                    planned_field_specs[full_name] = {
-                        "object_name": object_api_name,
-                        "field_api_name": field_api_name,
-                        "metadata": _build_field_metadata(field),
-                    }
+    return custom_results
 
-            relationships = custom_object.get("relationships")
-            if isinstance(relationships, list):
-                for relationship in relationships:
-                    if not isinstance(relationship, dict):
-                        continue
-                    relationship_api_name = str(relationship.get("api_name") or "").strip()
-                    if not relationship_api_name:
-                        components.append(
-                            {
-                                "type": "relationship",
-                                "api_name": f"{object_api_name}.",
-                                "success": False,
-                                "error": {
-                                    "code": "invalid_plan",
-                                    "message": f"Relationship entry for {object_api_name} is missing api_name",
-                                },
-                            }
-                        )
-                        continue
-                    full_name = f"{object_api_name}.{relationship_api_name}"
-                    planned_custom_components.append(
-                        ("relationship", full_name)
-                    )
-                    planned_field_specs[full_name] = {
-                        "object_name": object_api_name,
-                        "field_api_name": relationship_api_name,
-                        "metadata": _build_field_metadata(relationship),
-                    }
 
-        try:
-            zip_bytes = metadata_builder.build_custom_object_zip(metadata_custom_objects)
-            metadata_result = await salesforce.metadata_deploy_and_poll(
-                nango_connection_id=nango_connection_id,
-                zip_bytes=zip_bytes,
-                provider_config_key=provider_config_key,
-            )
-            deploy_status = _metadata_status(metadata_result)
-            success_map, failure_map = _metadata_component_maps(metadata_result)
+async def _create_standard_object_fields(
+    nango_connection_id: str,
+    field_components: list[dict],
+    field_creates: list[dict],
+    provider_config_key: str | None = None,
+) -> None:
+    """Create planned standard-object fields and fill in their placeholder components."""
+    field_responses = await _create_fields_batched(
+        nango_connection_id,
+        field_creates,
+        provider_config_key=provider_config_key,
+    )
+    for field_component, field_response in zip(field_components, field_responses):
+        field_success = bool(field_response.get("success"))
+        field_component["success"] = field_success
+        field_component["sfdc_id"] = field_response.get("id")
+        if not field_success:
+            field_component["error"] = _extract_tooling_error(field_response)
 
-            for component_type, api_name in planned_custom_components:
-                failed_component = failure_map.get(api_name)
-                successful_component = success_map.get(api_name)
 
-                success = bool(successful_component) and not bool(failed_component)
-                if not success and not failed_component and deploy_status == "Succeeded":
-                    success = True
+async def execute_deployment(
+    nango_connection_id: str,
+    plan: dict,
+    *,
+    pool,
+    org_id: str,
+    client_id,
+    provider_config_key: str | None = None,
+) -> dict:
+    validation_errors = validate_custom_object_plan(plan, max_errors=MAX_REPORTED_VALIDATION_ERRORS)
+    if validation_errors:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "invalid_deploy_plan", "errors": validation_error_details(validation_errors)},
+        )
 
-                component_result: dict = {
-                    "type": component_type,
-                    "api_name": api_name,
-                    "success": success,
-                    "sfdc_id": (
-                        (successful_component or {}).get("id")
-                        or (successful_component or {}).get("componentId")
-                    ),
+    # validate_custom_object_plan guarantees custom_objects, fields and relationships are
+    # lists of dicts with non-empty api_name strings, so the planning loop reads them directly.
+    metadata_custom_objects: list[dict] = plan.get("custom_objects") or []
+    planned_custom_components: list[tuple[str, str]] = []
+    planned_field_specs: dict[str, dict] = {}
+    plan_component = planned_custom_components.append
+    for custom_object in metadata_custom_objects:
+        object_api_name = custom_object["api_name"].strip()
+        plan_component(("custom_object", object_api_name))
+
+        for plan_key, component_type in (("fields", "custom_field"), ("relationships", "relationship")):
+            for entry in custom_object.get(plan_key) or []:
+                entry_api_name = entry["api_name"].strip()
+                full_name = f"{object_api_name}.{entry_api_name}"
+                plan_component((component_type, full_name))
+                planned_field_specs[full_name] = {
+                    "object_name": object_api_name,
+                    "field_api_name": entry_api_name,
+                    "metadata": _build_field_metadata(entry),
                 }
 
-                if not success:
-                    if failed_component:
-                        component_result["error"] = _metadata_failure_to_error(failed_component)
-                    else:
-                        component_result["error"] = {
-                            "code": "metadata_deploy_failed",
-                            "message": f"Metadata deploy ended with status {deploy_status}",
-                        }
-                else:
-                    # Metadata deploy can report "Succeeded" without returning per-field successes.
-                    # Verify custom fields exist and backfill via Tooling API if missing.
-                    if component_type in {"custom_field", "relationship"}:
-                        resolved_field_id = await _resolve_field_id(
-                            nango_connection_id=nango_connection_id,
-                            full_name=api_name,
-                            provider_config_key=provider_config_key,
-                        )
-                        if resolved_field_id:
-                            component_result["sfdc_id"] = resolved_field_id
-                        else:
-                            field_spec = planned_field_specs.get(api_name)
-                            if field_spec:
-                                create_response = await salesforce.tooling_create_custom_field(
-                                    nango_connection_id=nango_connection_id,
-                                    object_name=str(field_spec["object_name"]),
-                                    field_api_name=str(field_spec["field_api_name"]),
-                                    metadata=dict(field_spec["metadata"]),
-                                    provider_config_key=provider_config_key,
-                                )
-                                create_success = bool(create_response.get("success"))
-                                component_result["success"] = create_success
-                                component_result["sfdc_id"] = create_response.get("id")
-                                if not create_success:
-                                    component_result["error"] = _extract_tooling_error(create_response)
-                                else:
-                                    component_result.pop("error", None)
-                            else:
-                                component_result["success"] = False
-                                component_result["error"] = {
-                                    "code": "field_verification_failed",
-                                    "message": f"Could not verify or create field {api_name}",
-                                }
-
-                    if not component_result.get("success"):
-                        components.append(component_result)
-                        continue
-
-                    if component_type == "custom_object":
-                        objects_created += 1
-                    elif component_type == "custom_field":
-                        fields_created += 1
-                    elif component_type == "relationship":
-                        relationships_created += 1
-
-                components.append(component_result)
-
-            try:
-                await _best_effort_auto_map_custom_objects(
-                    pool=pool,
-                    org_id=org_id,
-                    client_id=client_id,
-                    components=components,
-                )
-            except Exception:
-                logger.exception(
-                    "Auto-mapping upsert failed after deployment",
-                    extra={
-                        "org_id": org_id,
-                        "client_id": str(client_id),
-                    },
-                )
-        except HTTPException as exc:
-            for component_type, api_name in planned_custom_components:
-                components.append(
-                    _metadata_failure_component(
-                        component_type=component_type,
-                        api_name=api_name,
-                        detail=exc.detail,
-                    )
-                )
-
     standard_object_fields = plan.get("standard_object_fields")
     if not isinstance(standard_object_fields, list):
         standard_object_fields = []
 
+    standard_components: list[dict] = []
+    pending_field_components: list[dict] = []
+    pending_field_creates: list[dict] = []
     for entry in standard_object_fields:
         if not isinstance(entry, dict):
             continue
-        object_name = str(entry.get("object") or "").strip()
+        object_name = _stripped_str(entry, "object")
         if not object_name:
             continue
         fields = entry.get("fields")
@@ -991,9 +984,9 @@ async def execute_deployment(
         for field in fields:
             if not isinstance(field, dict):
                 continue
-            field_api_name = str(field.get("api_name") or "").strip()
+            field_api_name = _stripped_str(field, "api_name")
             if not field_api_name:
-                components.append(
+                standard_components.append(
                     {
                         "type": "custom_field",
                         "api_name": f"{object_name}.",
@@ -1006,61 +999,175 @@ async def execute_deployment(
                 )
                 continue
 
-            field_response = await salesforce.tooling_create_custom_field(
-                nango_connection_id=nango_connection_id,
-                object_name=object_name,
-                field_api_name=field_api_name,
-                metadata=_build_field_metadata(field),
-                provider_config_key=provider_config_key,
-            )
-            field_success = bool(field_response.get("success"))
+            # Placeholder keeps plan order; filled in once the batched creates finish.
             field_component: dict = {
                 "type": "custom_field",
                 "api_name": f"{object_name}.{field_api_name}",
-                "success": field_success,
-                "sfdc_id": field_response.get("id"),
             }
-            if not field_success:
-                field_component["error"] = _extract_tooling_error(field_response)
-            else:
-                fields_created += 1
-            components.append(field_component)
+            standard_components.append(field_component)
+            pending_field_components.append(field_component)
+            pending_field_creates.append(
+                {
+                    "object_name": object_name,
+                    "field_api_name": field_api_name,
+                    "metadata": _build_field_metadata(field),
+                }
+            )
+
+    # Standard-object fields that reference a custom object from this plan must wait for it
+    # to exist; otherwise their Tooling creates overlap the Metadata deploy and poll.
+    planned_object_names = {
+        api_name
+        for component_type, api_name in planned_custom_components
+        if component_type == "custom_object"
+    }
+    depends_on_custom_objects = any(
+        field_create["metadata"].get("referenceTo") in planned_object_names
+        for field_create in pending_field_creates
+    )
+
+    create_standard_fields = _create_standard_object_fields(
+        nango_connection_id,
+        pending_field_components,
+        pending_field_creates,
+        provider_config_key=provider_config_key,
+    )
+    custom_components: list[dict] = []
+    if not metadata_custom_objects:
+        await create_standard_fields
+    else:
+        deploy_custom_objects = _deploy_custom_objects(
+            nango_connection_id,
+            metadata_custom_objects,
+            planned_custom_components,
+            planned_field_specs,
+            pool=pool,
+            org_id=org_id,
+            client_id=client_id,
+            provider_config_key=provider_config_key,
+        )
+        if depends_on_custom_objects:
+            custom_components = await deploy_custom_objects
+            await create_standard_fields
+        else:
+            custom_components, _ = await asyncio.gather(deploy_custom_objects, create_standard_fields)
+
+    # Tally successes while assembling the response instead of re-scanning it afterwards.
+    components: list[dict] = []
+    created_by_type: Counter[str] = Counter()
+    for component in (*custom_components, *standard_components):
+        components.append(component)
+        if component.get("success"):
+            created_by_type[component["type"]] += 1
 
-    total_components = len(components)
-    successful_components = sum(1 for component in components if component.get("success"))
     return {
-        "status": _resolve_deployment_status(total_components, successful_components),
-        "objects_created": objects_created,
-        "fields_created": fields_created,
-        "relationships_created": relationships_created,
+        "status": _resolve_deployment_status(len(components), sum(created_by_type.values())),
+        "objects_created": created_by_type["custom_object"],
+        "fields_created": created_by_type["custom_field"],
+        "relationships_created": created_by_type["relationship"],
         "components": components,
     }
 
 
+def _table_enum_key(table_enum_or_id: str) -> str:
+    # Tooling may echo custom object IDs in 15-character form; API names match case-insensitively.
+    if len(table_enum_or_id) in (15, 18) and table_enum_or_id.startswith("01I"):
+        return table_enum_or_id[:15]
+    return table_enum_or_id.lower()
+
+
+async def _resolve_field_ids(
+    nango_connection_id: str,
+    full_names: list[str],
+    provider_config_key: str | None = None,
+) -> dict[str, str]:
+    """Resolve CustomField IDs for many `Object.Field` names with batched Tooling queries."""
+    targets: list[tuple[str, str, str]] = []
+    for full_name in dict.fromkeys(full_names):
+        if "." not in full_name:
+            continue
+        object_name, field_api_name = full_name.split(".", 1)
+        targets.append((full_name, object_name, _strip_custom_suffix(field_api_name)))
+    if not targets:
+        return {}
+
+    object_ids = await _resolve_object_ids(
+        nango_connection_id,
+        [object_name for _, object_name, _ in targets],
+        provider_config_key=provider_config_key,
+    )
+    table_by_object = {
+        object_name: object_ids.get(object_name, object_name) for _, object_name, _ in targets
+    }
+
+    queries = []
+    for offset in range(0, len(targets), SOQL_IN_CHUNK_SIZE):
+        chunk = targets[offset : offset + SOQL_IN_CHUNK_SIZE]
+        tables = dict.fromkeys(table_by_object[object_name] for _, object_name, _ in chunk)
+        developer_names = dict.fromkeys(developer_name for _, _, developer_name in chunk)
+        queries.append(
+            salesforce.tooling_query(
+                nango_connection_id,
+                _FIELD_IDS_SOQL.format(_soql_in_list(tables), _soql_in_list(developer_names)),
+                provider_config_key=provider_config_key,
+            )
+        )
+
+    found: dict[tuple[str, str], str] = {}
+    for records in await asyncio.gather(*queries):
+        for record in records:
+            record_id = record.get("Id")
+            if not record_id:
+                continue
+            key = (
+                _table_enum_key(str(record.get("TableEnumOrId") or "")),
+                str(record.get("DeveloperName") or "").lower(),
+            )
+            # Newest first, so keep the first ID seen per key.
+            found.setdefault(key, str(record_id))
+
+    resolved: dict[str, str] = {}
+    for full_name, object_name, developer_name in targets:
+        record_id = found.get((_table_enum_key(table_by_object[object_name]), developer_name.lower()))
+        if record_id:
+            resolved[full_name] = record_id
+    return resolved
+
+
 async def _resolve_field_id(
     nango_connection_id: str,
     full_name: str,
     provider_config_key: str | None = None,
+    object_id_cache: dict[str, asyncio.Future] | None = None,
 ) -> str | None:
+    """Resolve one CustomField ID; `object_id_cache` shares parent object lookups across calls."""
     if "." not in full_name:
         return None
     object_name, field_api_name = full_name.split(".", 1)
     developer_name = _strip_custom_suffix(field_api_name)
     table_enum_or_id = object_name
     if object_name.endswith("__c"):
-        object_id = await _resolve_object_id(
-            nango_connection_id,
-            object_name,
-            provider_config_key=provider_config_key,
-        )
+        if object_id_cache is None:
+            object_id = await _resolve_object_id(
+                nango_connection_id,
+                object_name,
+                provider_config_key=provider_config_key,
+            )
+        else:
+            # Concurrent callers share one in-flight lookup per parent object.
+            pending = object_id_cache.get(object_name)
+            if pending is None:
+                pending = object_id_cache[object_name] = asyncio.ensure_future(
+                    _resolve_object_id(
+                        nango_connection_id,
+                        object_name,
+                        provider_config_key=provider_config_key,
+                    )
+                )
+            object_id = await pending
         if object_id:
             table_enum_or_id = object_id
-    soql = (
-        "SELECT Id FROM CustomField "
-        f"WHERE DeveloperName = '{_soql_escape(developer_name)}' "
-        f"AND TableEnumOrId = '{_soql_escape(table_enum_or_id)}' "
-        "ORDER BY CreatedDate DESC LIMIT 1"
-    )
+    soql = _FIELD_ID_SOQL.format(_soql_escape(developer_name), _soql_escape(table_enum_or_id))
     records = await salesforce.tooling_query(
         nango_connection_id,
         soql,
@@ -1078,11 +1185,7 @@ async def _resolve_object_id(
     provider_config_key: str | None = None,
 ) -> str | None:
     developer_name = _strip_custom_suffix(object_api_name)
-    soql = (
-        "SELECT Id FROM CustomObject "
-        f"WHERE DeveloperName = '{_soql_escape(developer_name)}' "
-        "ORDER BY CreatedDate DESC LIMIT 1"
-    )
+    soql = _OBJECT_ID_SOQL.format(_soql_escape(developer_name))
     records = await salesforce.tooling_query(
         nango_connection_id,
         soql,
@@ -1094,27 +1197,219 @@ async def _resolve_object_id(
     return str(record_id) if record_id else None
 
 
-async def _rollback_component(
+async def _resolve_object_ids(
+    nango_connection_id: str,
+    object_api_names: list[str],
+    provider_config_key: str | None = None,
+) -> dict[str, str]:
+    """Resolve CustomObject IDs for many `__c` API names with batched Tooling queries."""
+    names_by_developer_name: dict[str, list[str]] = {}
+    for object_api_name in dict.fromkeys(object_api_names):
+        if object_api_name[-3:] == "__c":
+            names_by_developer_name.setdefault(object_api_name[:-3].lower(), []).append(object_api_name)
+    if not names_by_developer_name:
+        return {}
+
+    developer_names = list(names_by_developer_name)
+    queries = []
+    for offset in range(0, len(developer_names), SOQL_IN_CHUNK_SIZE):
+        chunk = developer_names[offset : offset + SOQL_IN_CHUNK_SIZE]
+        queries.append(
+            salesforce.tooling_query(
+                nango_connection_id,
+                _OBJECT_IDS_SOQL.format(_soql_in_list(chunk)),
+                provider_config_key=provider_config_key,
+            )
+        )
+
+    resolved: dict[str, str] = {}
+    for records in await asyncio.gather(*queries):
+        for record in records:
+            record_id = record.get("Id")
+            developer_name = str(record.get("DeveloperName") or "").lower()
+            if not record_id:
+                continue
+            for object_api_name in names_by_developer_name.get(developer_name, []):
+                # Newest first, so keep the first ID seen per object.
+                resolved.setdefault(object_api_name, str(record_id))
+    return resolved
+
+
+async def _rollback_field_id(
     nango_connection_id: str,
     component: dict,
     provider_config_key: str | None = None,
-) -> dict:
-    component_type = str(component.get("type", ""))
-    api_name = str(component.get("api_name") or "")
-    resolved_id = component.get("sfdc_id")
+    object_id_cache: dict[str, asyncio.Future] | None = None,
+) -> str | None:
+    """Look up a rolled-back field's current ID, falling back to the ID stored at deploy time."""
+    # Components come from execute_deployment results, where these values are already strings.
+    api_name = component.get("api_name") or ""
+    resolved_id = None
+    if api_name:
+        resolved_id = await _resolve_field_id(
+            nango_connection_id,
+            api_name,
+            provider_config_key=provider_config_key,
+            object_id_cache=object_id_cache,
+        )
+    return resolved_id or component.get("sfdc_id")
+
+
+def _parent_object_name(component: dict) -> str:
+    api_name = component.get("api_name") or ""
+    return api_name.split(".", 1)[0] if "." in api_name else ""
 
+
+def _deleted_with_parent_result(component: dict) -> dict:
+    return {
+        "type": str(component.get("type") or "custom_field"),
+        "api_name": component.get("api_name") or "",
+        "success": True,
+        "sfdc_id": component.get("sfdc_id"),
+        "skipped": True,
+        "reason": "Deleted with parent custom object",
+    }
+
+
+def _planned_reference_targets(plan: dict) -> dict[str, str]:
+    """Map each planned `Object.Field` to the object it references, "" for non-lookup fields."""
+    entries: list[tuple[object, object]] = []
+    for custom_object in plan.get("custom_objects") or []:
+        if isinstance(custom_object, dict):
+            for plan_key in ("fields", "relationships"):
+                entries.append((custom_object.get("api_name"), custom_object.get(plan_key)))
+    for standard_object in plan.get("standard_object_fields") or []:
+        if isinstance(standard_object, dict):
+            entries.append((standard_object.get("object"), standard_object.get("fields")))
+
+    targets: dict[str, str] = {}
+    for object_name, fields in entries:
+        if not isinstance(object_name, str) or not isinstance(fields, list):
+            continue
+        for field in fields:
+            if isinstance(field, dict) and isinstance(field.get("api_name"), str):
+                target = field.get("related_to") or field.get("referenceTo") or ""
+                targets[f"{object_name.strip()}.{field['api_name'].strip()}"] = str(target).strip()
+    return targets
+
+
+def _blocks_object_drop(component: dict, reference_targets: dict[str, str], dropping_object_names) -> bool:
+    """Whether a field may reference a dropping object, so must be deleted before the drop."""
+    api_name = component.get("api_name") or ""
+    if api_name not in reference_targets:
+        # Not in the deployment plan, so its reference target is unknown.
+        return bool(dropping_object_names)
+    return reference_targets[api_name] in dropping_object_names
+
+
+async def _drop_custom_objects(
+    nango_connection_id: str,
+    object_components: list[dict],
+    provider_config_key: str | None = None,
+) -> list[dict]:
+    """Delete rolled-back custom objects with one destructive Metadata deploy, newest first."""
+    # execute_deployment stores api_name pre-stripped, so it is read as-is here.
+    objects_in_order = [component for component in reversed(object_components) if component.get("api_name")]
+    object_names_for_deploy = list(dict.fromkeys(component["api_name"] for component in objects_in_order))
     try:
-        if component_type in {"custom_field", "relationship"}:
-            if api_name:
-                resolved_id = await _resolve_field_id(
+        zip_bytes = metadata_builder.build_destructive_deploy_zip(object_names_for_deploy)
+        metadata_result = await salesforce.metadata_deploy_and_poll(
+            nango_connection_id=nango_connection_id,
+            zip_bytes=zip_bytes,
+            provider_config_key=provider_config_key,
+        )
+    except HTTPException as exc:
+        error = _metadata_failure_error(exc.detail)
+        return [
+            {
+                "type": "custom_object",
+                "api_name": component["api_name"],
+                "success": False,
+                "sfdc_id": component.get("sfdc_id"),
+                "error": error,
+            }
+            for component in objects_in_order
+        ]
+
+    # Deploys run with rollbackOnError, so the overall status decides success.
+    deploy_status, _, failure_map = _parse_metadata_result(metadata_result)
+    object_results: list[dict] = []
+    for component in objects_in_order:
+        api_name = component["api_name"]
+        failed_component = failure_map.get(api_name)
+        success = not failed_component and deploy_status == "Succeeded"
+
+        result: dict = {
+            "type": "custom_object",
+            "api_name": api_name,
+            "success": success,
+            "sfdc_id": str(component.get("sfdc_id") or "") or None,
+        }
+        if not success:
+            if failed_component:
+                result["error"] = _metadata_failure_to_error(failed_component)
+            else:
+                result["error"] = {
+                    "code": "metadata_deploy_failed",
+                    "message": f"Destructive deploy ended with status {deploy_status}",
+                }
+        object_results.append(result)
+    return object_results
+
+
+async def _delete_rollback_fields(
+    nango_connection_id: str,
+    field_components: list[dict],
+    provider_config_key: str | None = None,
+) -> list[dict]:
+    """Resolve and delete rolled-back CustomFields, one result per component in order."""
+    if not field_components:
+        return []
+
+    try:
+        resolved_field_ids = await _resolve_field_ids(
+            nango_connection_id,
+            [component.get("api_name") or "" for component in field_components],
+            provider_config_key=provider_config_key,
+        )
+        record_ids: list = [
+            resolved_field_ids.get(component.get("api_name") or "") or component.get("sfdc_id")
+            for component in field_components
+        ]
+    except HTTPException:
+        # Fall back to per-field lookups, sharing parent object IDs across fields.
+        object_id_cache: dict[str, asyncio.Future] = {}
+        record_ids = await _gather_limited(
+            [
+                _rollback_field_id(
                     nango_connection_id,
-                    api_name,
+                    component,
                     provider_config_key=provider_config_key,
+                    object_id_cache=object_id_cache,
                 )
-            if not resolved_id and component.get("sfdc_id"):
-                resolved_id = str(component.get("sfdc_id"))
-            if not resolved_id:
-                return {
+                for component in field_components
+            ]
+        )
+
+    results: list[dict] = []
+    deletes: list[tuple[int, dict, str]] = []
+    for component, record_id in zip(field_components, record_ids):
+        component_type = component.get("type", "")
+        api_name = component.get("api_name") or ""
+        if isinstance(record_id, HTTPException):
+            results.append(
+                {
+                    "type": component_type,
+                    "api_name": api_name,
+                    "success": False,
+                    "error": _metadata_failure_error(record_id.detail),
+                }
+            )
+        elif isinstance(record_id, BaseException):
+            raise record_id
+        elif not record_id:
+            results.append(
+                {
                     "type": component_type,
                     "api_name": api_name,
                     "success": False,
@@ -1123,167 +1418,124 @@ async def _rollback_component(
                         "message": "Could not resolve Salesforce field ID for rollback",
                     },
                 }
-
-            delete_result = await salesforce.tooling_delete(
-                nango_connection_id=nango_connection_id,
-                sobject_type="CustomField",
-                record_id=str(resolved_id),
-                provider_config_key=provider_config_key,
             )
-            rollback_result: dict = {
-                "type": component_type,
-                "api_name": api_name,
-                "success": bool(delete_result.get("success")),
-                "sfdc_id": str(resolved_id),
-            }
-            if not rollback_result["success"]:
-                rollback_result["error"] = _extract_tooling_error(delete_result)
-            return rollback_result
+        else:
+            deletes.append((len(results), component, record_id))
+            results.append({})
 
-    except HTTPException as exc:
-        detail = exc.detail if isinstance(exc.detail, dict) else {"message": str(exc.detail)}
-        return {
-            "type": component_type,
-            "api_name": api_name,
-            "success": False,
-            "error": _normalize_error(detail),
+    delete_results = await _delete_fields_batched(
+        nango_connection_id,
+        [record_id for _, _, record_id in deletes],
+        provider_config_key=provider_config_key,
+    )
+    for (position, component, record_id), delete_result in zip(deletes, delete_results):
+        delete_success = bool(delete_result.get("success"))
+        results[position] = {
+            "type": component.get("type", ""),
+            "api_name": component.get("api_name") or "",
+            "success": delete_success,
+            "sfdc_id": record_id,
+            **({} if delete_success else {"error": _extract_tooling_error(delete_result)}),
         }
-
-    return {
-        "type": component_type,
-        "api_name": api_name,
-        "success": False,
-        "error": {
-            "code": "unsupported_component",
-            "message": f"Rollback is not supported for component type {component_type}",
-        },
-    }
+    return results
 
 
 async def execute_rollback(
     nango_connection_id: str,
     deployment_result: dict,
     provider_config_key: str | None = None,
+    deployment_plan: dict | None = None,
 ) -> dict:
     components = deployment_result.get("components")
     if not isinstance(components, list):
         components = []
 
-    successful_components = [
-        component
-        for component in components
-        if isinstance(component, dict) and bool(component.get("success"))
-    ]
-    field_like_components = [
-        component
-        for component in successful_components
-        if str(component.get("type")) in {"custom_field", "relationship"}
-    ]
-    object_components = [
-        component
-        for component in successful_components
-        if str(component.get("type")) == "custom_object"
-    ]
-
-    rollback_components: list[dict] = []
-    object_names_for_delete = {
-        str(component.get("api_name") or "").strip()
-        for component in object_components
-        if str(component.get("api_name") or "").strip()
-    }
-
-    for component in reversed(field_like_components):
-        api_name = str(component.get("api_name") or "").strip()
-        object_name = api_name.split(".", 1)[0] if "." in api_name else ""
-        if object_name and object_name in object_names_for_delete:
-            rollback_components.append(
-                {
-                    "type": str(component.get("type") or "custom_field"),
-                    "api_name": api_name,
-                    "success": True,
-                    "sfdc_id": component.get("sfdc_id"),
-                    "skipped": True,
-                    "reason": "Deleted with parent custom object",
-                }
-            )
+    field_like_components: list[dict] = []
+    object_components: list[dict] = []
+    for component in components:
+        if not isinstance(component, dict) or not component.get("success"):
             continue
-
-        rollback_components.append(
-            await _rollback_component(
-                nango_connection_id=nango_connection_id,
-                component=component,
-                provider_config_key=provider_config_key,
-            )
+        component_type = component.get("type")
+        if component_type in _FIELD_LIKE_TYPES:
+            field_like_components.append(component)
+        elif component_type == "custom_object":
+            object_components.append(component)
+
+    # Fields on dropping objects wait for the destructive deploy: deleting the object
+    # cascades to them. A lookup from another object onto a dropping object makes
+    # Salesforce reject the drop, so, like depends_on_custom_objects on the deploy side,
+    # those fields are deleted before it starts. Only fields that cannot reference a
+    # dropping object are deleted while the deploy runs.
+    dropping_object_names = frozenset(component.get("api_name") for component in object_components)
+    reference_targets = _planned_reference_targets(deployment_plan) if deployment_plan else {}
+    fields_in_order = field_like_components[::-1]
+    referencing_fields: list[tuple[int, dict]] = []
+    independent_fields: list[tuple[int, dict]] = []
+    dependent_fields: list[tuple[int, dict]] = []
+    for position, component in enumerate(fields_in_order):
+        if _parent_object_name(component) in dropping_object_names:
+            dependent_fields.append((position, component))
+        elif _blocks_object_drop(component, reference_targets, dropping_object_names):
+            referencing_fields.append((position, component))
+        else:
+            independent_fields.append((position, component))
+
+    referencing_results = await _delete_rollback_fields(
+        nango_connection_id,
+        [component for _, component in referencing_fields],
+        provider_config_key=provider_config_key,
+    )
+    delete_independent_fields = _delete_rollback_fields(
+        nango_connection_id,
+        [component for _, component in independent_fields],
+        provider_config_key=provider_config_key,
+    )
+    if object_components:
+        object_results, independent_results = await asyncio.gather(
+            _drop_custom_objects(nango_connection_id, object_components, provider_config_key),
+            delete_independent_fields,
         )
+    else:
+        object_results, independent_results = [], await delete_independent_fields
+
+    deleted_object_names: set[str] = set()
+    successful_count = 0
+    for result in object_results:
+        if result["success"]:
+            deleted_object_names.add(result["api_name"])
+            successful_count += 1
+    if not independent_fields and not referencing_fields and all(
+        _parent_object_name(component) in deleted_object_names for _, component in dependent_fields
+    ):
+        # The whole object tree dropped, so every field went with its parent.
+        rollback_components = [_deleted_with_parent_result(component) for component in fields_in_order]
+        successful_count += len(rollback_components)
+    else:
+        rollback_components = [_EMPTY_COMPONENT] * len(fields_in_order)
+        for (position, _), result in zip(
+            referencing_fields + independent_fields, referencing_results + independent_results
+        ):
+            rollback_components[position] = result
+            successful_count += result["success"]
+        surviving_fields: list[tuple[int, dict]] = []
+        for position, component in dependent_fields:
+            if _parent_object_name(component) in deleted_object_names:
+                rollback_components[position] = _deleted_with_parent_result(component)
+                successful_count += 1
+            else:
+                surviving_fields.append((position, component))
+        surviving_results = await _delete_rollback_fields(
+            nango_connection_id,
+            [component for _, component in surviving_fields],
+            provider_config_key=provider_config_key,
+        )
+        for (position, _), result in zip(surviving_fields, surviving_results):
+            rollback_components[position] = result
+            successful_count += result["success"]
 
-    if object_components:
-        object_names_in_order = [
-            str(component.get("api_name") or "").strip()
-            for component in reversed(object_components)
-            if str(component.get("api_name") or "").strip()
-        ]
-        object_names_for_deploy = list(dict.fromkeys(object_names_in_order))
-        try:
-            zip_bytes = metadata_builder.build_destructive_deploy_zip(object_names_for_deploy)
-            metadata_result = await salesforce.metadata_deploy_and_poll(
-                nango_connection_id=nango_connection_id,
-                zip_bytes=zip_bytes,
-                provider_config_key=provider_config_key,
-            )
-            deploy_status = _metadata_status(metadata_result)
-            success_map, failure_map = _metadata_component_maps(metadata_result)
-
-            for component in reversed(object_components):
-                api_name = str(component.get("api_name") or "").strip()
-                if not api_name:
-                    continue
-                failed_component = failure_map.get(api_name)
-                successful_component = success_map.get(api_name)
-
-                success = bool(successful_component) and not bool(failed_component)
-                if not success and not failed_component and deploy_status == "Succeeded":
-                    success = True
-
-                result: dict = {
-                    "type": "custom_object",
-                    "api_name": api_name,
-                    "success": success,
-                    "sfdc_id": str(
-                        component.get("sfdc_id")
-                        or (successful_component or {}).get("id")
-                        or (successful_component or {}).get("componentId")
-                        or ""
-                    )
-                    or None,
-                }
-                if not success:
-                    if failed_component:
-                        result["error"] = _metadata_failure_to_error(failed_component)
-                    else:
-                        result["error"] = {
-                            "code": "metadata_deploy_failed",
-                            "message": f"Destructive deploy ended with status {deploy_status}",
-                        }
-                rollback_components.append(result)
-        except HTTPException as exc:
-            for component in reversed(object_components):
-                api_name = str(component.get("api_name") or "").strip()
-                if not api_name:
-                    continue
-                rollback_components.append(
-                    {
-                        "type": "custom_object",
-                        "api_name": api_name,
-                        "success": False,
-                        "sfdc_id": component.get("sfdc_id"),
-                        "error": _normalize_error(
-                            exc.detail if isinstance(exc.detail, dict) else {"message": str(exc.detail)}
-                        ),
-                    }
-                )
+    rollback_components.extend(object_results)
 
     total_components = len(rollback_components)
-    successful_count = sum(1 for component in rollback_components if component.get("success"))
     return {
         "status": _resolve_deployment_status(total_components, successful_count),
         "components": rollback_components,
@@ -8,6 +8,10 @@ from app.config import settings
 METADATA_NS = "http://soap.sforce.com/2006/04/metadata"
 ET.register_namespace("", METADATA_NS)
 
+_NUMERIC_FIELD_TYPES = frozenset({"Number", "Currency", "Percent"})
+_RELATIONSHIP_FIELD_TYPES = frozenset({"Lookup", "MasterDetail"})
+_NO_EXTRA_METADATA_FIELD_TYPES = frozenset({"Date", "DateTime", "Phone", "Email", "Url"})
+
 
 def _ns(tag: str) -> str:
     return f"{{{METADATA_NS}}}{tag}"
@@ -87,7 +91,7 @@ def _build_field_xml(custom_object_el: ET.Element, field: dict) -> None:
 
     if field_type == "Text":
         _append_text(field_el, "length", int(field.get("length", 255)))
-    elif field_type in {"Number", "Currency", "Percent"}:
+    elif field_type in _NUMERIC_FIELD_TYPES:
         _append_text(field_el, "precision", int(field.get("precision", 18)))
         _append_text(field_el, "scale", int(field.get("scale", 2)))
     elif field_type == "Picklist":
@@ -96,7 +100,7 @@ def _build_field_xml(custom_object_el: ET.Element, field: dict) -> None:
         value_set_definition = ET.SubElement(value_set_el, _ns("valueSetDefinition"))
         values = field.get("values") if isinstance(field.get("values"), list) else []
         _append_picklist_values(value_set_definition, values)
-    elif field_type in {"Lookup", "MasterDetail"}:
+    elif field_type in _RELATIONSHIP_FIELD_TYPES:
         reference_to = str(field.get("related_to") or field.get("referenceTo") or "").strip()
         if reference_to:
             _append_text(field_el, "referenceTo", reference_to)
@@ -130,7 +134,7 @@ def _build_field_xml(custom_object_el: ET.Element, field: dict) -> None:
             "visibleLines",
             int(field.get("visible_lines", field.get("visibleLines", 3))),
         )
-    elif field_type in {"Date", "DateTime", "Phone", "Email", "Url"}:
+    elif field_type in _NO_EXTRA_METADATA_FIELD_TYPES:
         pass
 
 
@@ -528,11 +532,24 @@ def _destructive_changes_analytics_xml(
     return ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8")
 
 
+# Fixed member timestamps keep identical plans producing byte-identical zips.
+_ZIP_MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+# Packages are small XML files; fast compression is nearly as small as the default level.
+_ZIP_COMPRESSLEVEL = 1
+
+
 def _zip_bytes(files: dict[str, str]) -> bytes:
     buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+    with zipfile.ZipFile(buffer, mode="w") as archive:
         for path, content in files.items():
-            archive.writestr(path, content)
+            member = zipfile.ZipInfo(path, date_time=_ZIP_MEMBER_DATE_TIME)
+            member.external_attr = 0o600 << 16
+            archive.writestr(
+                member,
+                content,
+                compress_type=zipfile.ZIP_DEFLATED,
+                compresslevel=_ZIP_COMPRESSLEVEL,
+            )
     return buffer.getvalue()
 
 
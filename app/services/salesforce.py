@@ -1,6 +1,8 @@
 import asyncio
 import json
+import random
 import time
+from collections.abc import Awaitable, Callable
 
 import httpx
 from fastapi import HTTPException
@@ -9,6 +11,81 @@ from app.config import settings
 from app.services import token_manager
 from app.services.sfdc_client import get_sfdc_client
 
+# Full-topology describes can be slow on large orgs; other calls use the client default.
+DESCRIBE_TIMEOUT_SECONDS = 60.0
+# Salesforce caps a composite request at 25 subrequests.
+TOOLING_COMPOSITE_MAX_SUBREQUESTS = 25
+METADATA_DEPLOY_TERMINAL_STATES = frozenset({"Succeeded", "Failed", "Canceled"})
+# Deploy status polls back off exponentially from poll_interval up to this cap, with +/- jitter.
+METADATA_POLL_MAX_INTERVAL_SECONDS = 15.0
+METADATA_POLL_JITTER = 0.3
+# Tooling and Metadata requests are retried this many times in total on transient failures.
+TRANSIENT_RETRY_ATTEMPTS = 3
+TRANSIENT_RETRY_BASE_SECONDS = 0.5
+TRANSIENT_RETRY_MAX_SECONDS = 8.0
+TRANSIENT_RETRY_JITTER = 0.3
+
+
+def _backoff_delay(attempt: int, base: float, cap: float, jitter: float) -> float:
+    return min(cap, base * 2**attempt) * (1 + random.uniform(-jitter, jitter))
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Connection drops, 429s and Salesforce 5xx responses are worth retrying."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, HTTPException) and isinstance(exc.detail, dict):
+        status_code = exc.detail.get("status_code")
+        return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+    return False
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    try:
+        return min(TRANSIENT_RETRY_MAX_SECONDS, max(0.0, float(response.headers["Retry-After"])))
+    except (KeyError, ValueError):
+        return None
+
+
+async def _send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    idempotent: bool,
+) -> httpx.Response:
+    """Send a request, retrying transient failures with exponential backoff.
+
+    Connect failures and 429s never reached Salesforce's handlers, so they are always
+    retried. Dropped connections and 5xx responses are only retried for idempotent
+    requests, since a create may already have been applied.
+    """
+    attempt = 0
+    while True:
+        can_retry = attempt + 1 < TRANSIENT_RETRY_ATTEMPTS
+        delay = None
+        try:
+            response = await send()
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+            if not can_retry:
+                raise
+        except httpx.TransportError:
+            if not (can_retry and idempotent):
+                raise
+        else:
+            status_code = response.status_code
+            if not can_retry or not (status_code == 429 or (idempotent and status_code >= 500)):
+                return response
+            if status_code == 429:
+                delay = _retry_after_seconds(response)
+        if delay is None:
+            delay = _backoff_delay(
+                attempt,
+                TRANSIENT_RETRY_BASE_SECONDS,
+                TRANSIENT_RETRY_MAX_SECONDS,
+                TRANSIENT_RETRY_JITTER,
+            )
+        await asyncio.sleep(delay)
+        attempt += 1
+
 
 def _sfdc_headers(access_token: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {access_token}"}
@@ -242,8 +319,8 @@ async def list_sobjects(
         f"{settings.sfdc_api_version}/sobjects/"
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=_sfdc_headers(access_token))
+    client = get_sfdc_client()
+    response = await client.get(url, headers=_sfdc_headers(access_token))
 
     if response.status_code != 200:
         error_code, error_message = _parse_salesforce_error(response)
@@ -280,7 +357,11 @@ async def describe_sobject(
         f"{_sfdc_base_url(instance_url)}/services/data/"
         f"{settings.sfdc_api_version}/sobjects/{object_name}/describe/"
     )
-    response = await client.get(url, headers=_sfdc_headers(access_token))
+    response = await client.get(
+        url,
+        headers=_sfdc_headers(access_token),
+        timeout=DESCRIBE_TIMEOUT_SECONDS,
+    )
     if response.status_code != 200:
         return {
             "_error": True,
@@ -311,21 +392,22 @@ async def pull_full_topology(
     )
     semaphore = asyncio.Semaphore(10)
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        async def describe_with_limit(object_name: str) -> tuple[str, dict | None]:
-            async with semaphore:
-                payload = await describe_sobject(
-                    connection_id=connection_id,
-                    object_name=object_name,
-                    client=client,
-                    access_token=access_token,
-                    instance_url=instance_url,
-                )
-                return object_name, payload
+    client = get_sfdc_client()
 
-        results = await asyncio.gather(
-            *(describe_with_limit(object_name) for object_name in object_names)
-        )
+    async def describe_with_limit(object_name: str) -> tuple[str, dict | None]:
+        async with semaphore:
+            payload = await describe_sobject(
+                connection_id=connection_id,
+                object_name=object_name,
+                client=client,
+                access_token=access_token,
+                instance_url=instance_url,
+            )
+            return object_name, payload
+
+    results = await asyncio.gather(
+        *(describe_with_limit(object_name) for object_name in object_names)
+    )
 
     objects: dict[str, dict] = {}
     describe_errors: dict[str, dict] = {}
@@ -376,8 +458,8 @@ async def composite_upsert(
 
     payload = {"allOrNone": False, "records": enriched_records}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.patch(url, headers=_sfdc_headers(access_token), json=payload)
+    client = get_sfdc_client()
+    response = await client.patch(url, headers=_sfdc_headers(access_token), json=payload)
 
     if response.status_code != 200:
         error_code, error_message = _parse_salesforce_error(response)
@@ -430,8 +512,11 @@ async def tooling_create_custom_object(
     }
     headers = {**_sfdc_headers(access_token), "Content-Type": "application/json"}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers, json=payload)
+    client = get_sfdc_client()
+    response = await _send_with_retry(
+        lambda: client.post(url, headers=headers, json=payload),
+        idempotent=False,
+    )
 
     if response.status_code >= 400:
         error_code, error_message = _parse_salesforce_error(response)
@@ -485,8 +570,12 @@ async def tooling_create_custom_field(
     payload = {"FullName": f"{object_name}.{field_api_name}", "Metadata": metadata}
     headers = {**_sfdc_headers(access_token), "Content-Type": "application/json"}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers, json=payload)
+    client = get_sfdc_client()
+    content = _json_body(payload)
+    response = await _send_with_retry(
+        lambda: client.post(url, headers=headers, content=content),
+        idempotent=False,
+    )
 
     if response.status_code >= 400:
         error_code, error_message = _parse_salesforce_error(response)
@@ -522,6 +611,181 @@ async def tooling_create_custom_field(
     }
 
 
+def _json_body(payload: object) -> bytes:
+    """Serialize a Tooling request body compactly (httpx's json= keeps separator whitespace)."""
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _composite_error_results(count: int, error: dict) -> list[dict]:
+    return [{"id": None, "success": False, "errors": [error]} for _ in range(count)]
+
+
+async def _tooling_composite(
+    nango_connection_id: str,
+    subrequests: list[dict],
+    provider_config_key: str | None = None,
+    *,
+    idempotent: bool = False,
+) -> list[dict]:
+    """Send Tooling subrequests in one composite request with allOrNone=false.
+
+    Returns one `{id, success, errors}` result per subrequest, in subrequest order.
+    Pass `idempotent=True` only when every subrequest is safe to replay.
+    """
+    if len(subrequests) > TOOLING_COMPOSITE_MAX_SUBREQUESTS:
+        raise ValueError(
+            f"Tooling composite requests accept at most {TOOLING_COMPOSITE_MAX_SUBREQUESTS} subrequests"
+        )
+    if not subrequests:
+        return []
+
+    access_token, instance_url = await token_manager.get_valid_token(
+        nango_connection_id,
+        provider_config_key=provider_config_key,
+    )
+    url = (
+        f"{_sfdc_base_url(instance_url)}/services/data/{settings.sfdc_api_version}"
+        "/tooling/composite"
+    )
+    payload = {
+        "allOrNone": False,
+        "compositeRequest": [
+            {**subrequest, "referenceId": f"req{index}"} for index, subrequest in enumerate(subrequests)
+        ],
+    }
+    headers = {**_sfdc_headers(access_token), "Content-Type": "application/json"}
+
+    client = get_sfdc_client()
+    content = _json_body(payload)
+    response = await _send_with_retry(
+        lambda: client.post(url, headers=headers, content=content),
+        idempotent=idempotent,
+    )
+
+    if response.status_code >= 400:
+        error_code, error_message = _parse_salesforce_error(response)
+        error = _tooling_error_payload(error_code, error_message, status_code=response.status_code)
+        return _composite_error_results(len(subrequests), error)
+
+    body = response.json()
+    subresponses = body.get("compositeResponse") if isinstance(body, dict) else None
+    if not isinstance(subresponses, list):
+        error = _tooling_error_payload(
+            "salesforce_invalid_response",
+            "Tooling API composite response missing compositeResponse",
+        )
+        return _composite_error_results(len(subrequests), error)
+
+    by_reference = {
+        str(subresponse.get("referenceId")): subresponse
+        for subresponse in subresponses
+        if isinstance(subresponse, dict)
+    }
+    results: list[dict] = []
+    for index in range(len(subrequests)):
+        subresponse = by_reference.get(f"req{index}")
+        if subresponse is None:
+            results.append(
+                {
+                    "id": None,
+                    "success": False,
+                    "errors": [
+                        _tooling_error_payload(
+                            "salesforce_invalid_response",
+                            "Tooling API composite response missing subrequest result",
+                        )
+                    ],
+                }
+            )
+            continue
+
+        status_code = subresponse.get("httpStatusCode")
+        sub_body = subresponse.get("body")
+        if isinstance(status_code, int) and status_code >= 400:
+            errors = _parse_tooling_errors(sub_body)
+            first = errors[0] if errors else {}
+            results.append(
+                {
+                    "id": None,
+                    "success": False,
+                    "errors": [
+                        _tooling_error_payload(
+                            str(first.get("errorCode") or "salesforce_request_failed"),
+                            str(first.get("message") or "Salesforce API request failed"),
+                            status_code=status_code,
+                        )
+                    ],
+                }
+            )
+            continue
+
+        if status_code == 204:
+            # Successful deletes return no body.
+            results.append({"id": None, "success": True, "errors": []})
+            continue
+
+        if not isinstance(sub_body, dict):
+            sub_body = {}
+        results.append(
+            {
+                "id": sub_body.get("id"),
+                "success": bool(sub_body.get("success", False)),
+                "errors": _parse_tooling_errors(sub_body),
+            }
+        )
+    return results
+
+
+async def tooling_composite_create_fields(
+    nango_connection_id: str,
+    specs: list[dict],
+    provider_config_key: str | None = None,
+) -> list[dict]:
+    """Create up to TOOLING_COMPOSITE_MAX_SUBREQUESTS CustomFields in one composite request.
+
+    Each spec carries `object_name`, `field_api_name` and `metadata`. Returns one
+    `{id, success, errors}` result per spec, in spec order.
+    """
+    subrequest_url = f"/services/data/{settings.sfdc_api_version}/tooling/sobjects/CustomField"
+    return await _tooling_composite(
+        nango_connection_id,
+        [
+            {
+                "method": "POST",
+                "url": subrequest_url,
+                "body": {
+                    "FullName": f"{spec['object_name']}.{spec['field_api_name']}",
+                    "Metadata": spec["metadata"],
+                },
+            }
+            for spec in specs
+        ],
+        provider_config_key=provider_config_key,
+    )
+
+
+async def tooling_composite_delete(
+    nango_connection_id: str,
+    sobject_type: str,
+    record_ids: list[str],
+    provider_config_key: str | None = None,
+) -> list[dict]:
+    """Delete up to TOOLING_COMPOSITE_MAX_SUBREQUESTS Tooling records in one composite request.
+
+    Returns one `{id, success, errors}` result per record ID, in input order.
+    """
+    subrequest_url = f"/services/data/{settings.sfdc_api_version}/tooling/sobjects/{sobject_type}"
+    results = await _tooling_composite(
+        nango_connection_id,
+        [{"method": "DELETE", "url": f"{subrequest_url}/{record_id}"} for record_id in record_ids],
+        provider_config_key=provider_config_key,
+        idempotent=True,
+    )
+    for record_id, result in zip(record_ids, results):
+        result["id"] = record_id
+    return results
+
+
 async def tooling_query(
     nango_connection_id: str,
     soql: str,
@@ -536,12 +800,11 @@ async def tooling_query(
         "/tooling/query"
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            url,
-            headers=_sfdc_headers(access_token),
-            params={"q": soql},
-        )
+    client = get_sfdc_client()
+    response = await _send_with_retry(
+        lambda: client.get(url, headers=_sfdc_headers(access_token), params={"q": soql}),
+        idempotent=True,
+    )
 
     if response.status_code >= 400:
         error_code, error_message = _parse_salesforce_error(response)
@@ -581,8 +844,11 @@ async def tooling_delete(
         f"/tooling/sobjects/{sobject_type}/{record_id}"
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.delete(url, headers=_sfdc_headers(access_token))
+    client = get_sfdc_client()
+    response = await _send_with_retry(
+        lambda: client.delete(url, headers=_sfdc_headers(access_token)),
+        idempotent=True,
+    )
 
     if response.status_code >= 400:
         error_code, error_message = _parse_salesforce_error(response)
@@ -641,8 +907,12 @@ async def metadata_deploy(
         "file": ("deploy.zip", zip_bytes, "application/zip"),
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers, files=files)
+    client = get_sfdc_client()
+    # A replayed deployRequest would queue a second deploy, so only unsent requests retry.
+    response = await _send_with_retry(
+        lambda: client.post(url, headers=headers, files=files),
+        idempotent=False,
+    )
 
     if response.status_code != 201:
         raise HTTPException(status_code=502, detail=_metadata_error_payload(response))
@@ -674,15 +944,15 @@ async def metadata_deploy_status(
         f"/metadata/deployRequest/{deploy_id}"
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            url,
-            headers={
-                **_sfdc_headers(access_token),
-                "Accept": "application/json",
-            },
-            params={"includeDetails": "true"},
-        )
+    client = get_sfdc_client()
+    response = await client.get(
+        url,
+        headers={
+            **_sfdc_headers(access_token),
+            "Accept": "application/json",
+        },
+        params={"includeDetails": "true"},
+    )
 
     if response.status_code >= 400:
         raise HTTPException(status_code=502, detail=_metadata_error_payload(response))
@@ -703,7 +973,7 @@ async def metadata_deploy_status(
 async def metadata_deploy_and_poll(
     nango_connection_id: str,
     zip_bytes: bytes,
-    poll_interval: float = 3.0,
+    poll_interval: float = 1.0,
     timeout: float = 120.0,
     provider_config_key: str | None = None,
 ) -> dict:
@@ -713,25 +983,34 @@ async def metadata_deploy_and_poll(
         provider_config_key=provider_config_key,
     )
     deadline = time.monotonic() + timeout
-    terminal_states = {"Succeeded", "Failed", "Canceled"}
     last_payload: dict | None = None
+    attempt = 0
 
     while time.monotonic() < deadline:
-        payload = await metadata_deploy_status(
-            nango_connection_id,
-            deploy_id,
-            provider_config_key=provider_config_key,
-        )
-        last_payload = payload
-        deploy_result = payload.get("deployResult")
-        status = (
-            str(deploy_result.get("status"))
-            if isinstance(deploy_result, dict)
-            else str(payload.get("status") or "")
+        try:
+            payload = await metadata_deploy_status(
+                nango_connection_id,
+                deploy_id,
+                provider_config_key=provider_config_key,
+            )
+        except (httpx.TransportError, HTTPException) as exc:
+            # A flaky status check should not abandon a deploy that is still running.
+            if not _is_transient_error(exc):
+                raise
+        else:
+            last_payload = payload
+            deploy_result = payload.get("deployResult")
+            status = (
+                str(deploy_result.get("status"))
+                if isinstance(deploy_result, dict)
+                else str(payload.get("status") or "")
+            )
+            if status in METADATA_DEPLOY_TERMINAL_STATES:
+                return payload
+        await asyncio.sleep(
+            _backoff_delay(attempt, poll_interval, METADATA_POLL_MAX_INTERVAL_SECONDS, METADATA_POLL_JITTER)
         )
-        if status in terminal_states:
-            return payload
-        await asyncio.sleep(poll_interval)
+        attempt += 1
 
     raise HTTPException(
         status_code=502,
@@ -5,7 +5,16 @@ _client: httpx.AsyncClient | None = None
 
 async def init_sfdc_client() -> httpx.AsyncClient:
     global _client
-    _client = httpx.AsyncClient(timeout=30.0)
+    _client = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        # Deploys pause between Salesforce calls while polling; keep idle connections
+        # warm past httpx's 5s default so the next call skips the TLS handshake.
+        limits=httpx.Limits(
+            max_keepalive_connections=50,
+            max_connections=100,
+            keepalive_expiry=60.0,
+        ),
+    )
     return _client
 
 
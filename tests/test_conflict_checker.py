@@ -0,0 +1,123 @@
+"""Tests for pre-deploy conflict scoring."""
+
+from app.services.conflict_checker import check_conflicts
+
+
+def _topology(objects: dict) -> dict:
+    return {"objects": objects}
+
+
+def _messages(result: dict, severity: str) -> list[str]:
+    return [f["message"] for f in result["findings"] if f["severity"] == severity]
+
+
+class TestCustomObjects:
+    def test_new_object_is_green(self):
+        plan = {"custom_objects": [{"api_name": "Job__c", "fields": [{"api_name": "X__c"}]}]}
+        result = check_conflicts(plan, _topology({}))
+
+        assert result["findings"] == [
+            {
+                "severity": "green",
+                "category": "object_name",
+                "message": "Job__c does not exist - safe to create",
+            }
+        ]
+        assert result["overall_severity"] == "green"
+        assert (result["green_count"], result["yellow_count"], result["red_count"]) == (1, 0, 0)
+
+    def test_existing_object_scores_fields(self):
+        topology = _topology(
+            {
+                "Job__c": {
+                    "fields": [
+                        {"name": "Title__c", "type": "string"},
+                        {"name": "Salary__c", "type": "string"},
+                    ]
+                }
+            }
+        )
+        plan = {
+            "custom_objects": [
+                {
+                    "api_name": "Job__c",
+                    "fields": [
+                        {"api_name": "Title__c", "type": "Text"},
+                        {"api_name": "Salary__c", "type": "Currency"},
+                        {"api_name": "New__c", "type": "Text"},
+                    ],
+                }
+            ]
+        }
+        result = check_conflicts(plan, topology)
+
+        assert _messages(result, "red") == [
+            "Job__c already exists in topology snapshot",
+            "Job__c.Salary__c already exists with different type "
+            "(existing=string, requested=currency)",
+        ]
+        assert _messages(result, "yellow") == [
+            "Job__c.Title__c already exists with same type (string)"
+        ]
+        assert _messages(result, "green") == ["Job__c.New__c does not exist - safe to create"]
+        assert result["overall_severity"] == "red"
+
+    def test_malformed_entries_are_ignored(self):
+        plan = {"custom_objects": ["bad", {"api_name": ""}, {"fields": []}]}
+        result = check_conflicts(plan, {"objects": []})
+
+        assert result["findings"] == []
+        assert result["overall_severity"] == "green"
+
+
+class TestStandardObjectFields:
+    def test_missing_standard_object_is_red(self):
+        plan = {"standard_object_fields": [{"object": "Lead", "fields": []}]}
+        result = check_conflicts(plan, _topology({}))
+
+        assert _messages(result, "red") == ["Lead not found in topology snapshot"]
+
+    def test_required_fields_and_validation_rules_are_yellow(self):
+        topology = _topology(
+            {
+                "Lead": {
+                    "fields": [
+                        {"name": "LastName", "type": "string", "nillable": False, "defaultValue": None},
+                        {"name": "Company", "type": "string", "nillable": False, "defaultValue": None},
+                        {"name": "Email", "type": "email", "nillable": True},
+                    ],
+                    "validationRules": [{"active": True}],
+                }
+            }
+        )
+        plan = {
+            "standard_object_fields": [
+                {"object": "Lead", "fields": [{"api_name": "Company", "type": "Text"}]}
+            ]
+        }
+        result = check_conflicts(plan, topology)
+
+        assert _messages(result, "green") == ["Lead exists in topology snapshot"]
+        assert _messages(result, "yellow") == [
+            "Lead.Company already exists with same type (string)",
+            "Lead has required field 'LastName' not in deployment plan",
+            "Lead has active validation rules",
+        ]
+        assert result["overall_severity"] == "yellow"
+        assert (result["green_count"], result["yellow_count"], result["red_count"]) == (1, 3, 0)
+
+    def test_required_field_scan_covers_duplicate_describe_entries(self):
+        topology = _topology(
+            {
+                "Lead": {
+                    "fields": [
+                        {"name": "F2__c", "type": "string", "nillable": False, "defaultValue": None},
+                        {"name": "F2__c", "type": "string", "nillable": True},
+                    ],
+                }
+            }
+        )
+        plan = {"standard_object_fields": [{"object": "Lead", "fields": []}]}
+        result = check_conflicts(plan, topology)
+
+        assert _messages(result, "yellow") == ["Lead has required field 'F2__c' not in deployment plan"]
@@ -0,0 +1,90 @@
+"""Tests for the in-process crm_connections cache."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.services import connection_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    connection_cache._cache.clear()
+    connection_cache._last_touch.clear()
+    yield
+    connection_cache._cache.clear()
+    connection_cache._last_touch.clear()
+
+
+class TestConnectionCache:
+    @pytest.mark.asyncio
+    async def test_hit_skips_database(self):
+        row = {"id": uuid4(), "nango_connection_id": "n-1", "nango_provider_config_key": None}
+        pool = AsyncMock()
+        pool.fetchrow = AsyncMock(return_value=row)
+        client_id = uuid4()
+
+        first = await connection_cache.get_connected_connection(pool, "org-1", client_id)
+        second = await connection_cache.get_connected_connection(pool, "org-1", client_id)
+
+        assert first is row
+        assert second is row
+        assert pool.fetchrow.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_is_not_cached(self):
+        pool = AsyncMock()
+        pool.fetchrow = AsyncMock(return_value=None)
+        client_id = uuid4()
+
+        assert await connection_cache.get_connected_connection(pool, "org-1", client_id) is None
+        assert await connection_cache.get_connected_connection(pool, "org-1", client_id) is None
+        assert pool.fetchrow.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self):
+        pool = AsyncMock()
+        pool.fetchrow = AsyncMock(return_value={"id": uuid4()})
+        client_id = uuid4()
+
+        await connection_cache.get_connected_connection(pool, "org-1", client_id)
+        connection_cache.invalidate_connection("org-1", client_id)
+        await connection_cache.get_connected_connection(pool, "org-1", client_id)
+
+        assert pool.fetchrow.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, monkeypatch):
+        pool = AsyncMock()
+        pool.fetchrow = AsyncMock(return_value={"id": uuid4()})
+        client_id = uuid4()
+        monkeypatch.setattr(connection_cache, "CONNECTION_TTL_SECONDS", -1.0)
+
+        await connection_cache.get_connected_connection(pool, "org-1", client_id)
+        await connection_cache.get_connected_connection(pool, "org-1", client_id)
+
+        assert pool.fetchrow.await_count == 2
+
+
+class TestTouchLastUsed:
+    @pytest.mark.asyncio
+    async def test_repeated_touch_within_interval_writes_once(self):
+        pool = AsyncMock()
+        connection_id = uuid4()
+
+        await connection_cache.touch_last_used(pool, connection_id, "org-1")
+        await connection_cache.touch_last_used(pool, connection_id, "org-1")
+
+        assert pool.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_touch_after_interval_writes_again(self, monkeypatch):
+        pool = AsyncMock()
+        connection_id = uuid4()
+        monkeypatch.setattr(connection_cache, "LAST_USED_TOUCH_INTERVAL_SECONDS", 0.0)
+
+        await connection_cache.touch_last_used(pool, connection_id, "org-1")
+        await connection_cache.touch_last_used(pool, connection_id, "org-1")
+
+        assert pool.execute.await_count == 2
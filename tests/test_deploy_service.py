@@ -0,0 +1,872 @@
+"""Tests for the deploy service orchestration (Salesforce calls mocked)."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import deploy_service
+
+
+async def _deploy(plan: dict) -> dict:
+    return await deploy_service.execute_deployment(
+        "nango-1",
+        plan,
+        pool=AsyncMock(),
+        org_id="org-1",
+        client_id="client-1",
+    )
+
+
+class TestStandardObjectFields:
+    @pytest.mark.asyncio
+    async def test_fields_created_in_composite_batches_in_plan_order(self):
+        async def create_fields(nango_connection_id, specs, provider_config_key=None):
+            results = []
+            for spec in specs:
+                if spec["field_api_name"] == "Bad__c":
+                    results.append(
+                        {
+                            "id": None,
+                            "success": False,
+                            "errors": [{"errorCode": "DUPLICATE_DEVELOPER_NAME", "message": "dup"}],
+                        }
+                    )
+                else:
+                    results.append({"id": f"00N{spec['field_api_name']}", "success": True, "errors": []})
+            return results
+
+        plan = {
+            "standard_object_fields": [
+                {
+                    "object": "Lead",
+                    "fields": [
+                        {"api_name": "Score__c", "type": "Number"},
+                        {"label": "No api name", "type": "Text"},
+                        {"api_name": "Bad__c", "type": "Text"},
+                    ],
+                }
+            ]
+        }
+        with patch.object(
+            deploy_service.salesforce,
+            "tooling_composite_create_fields",
+            AsyncMock(side_effect=create_fields),
+        ) as create_mock:
+            result = await _deploy(plan)
+
+        create_mock.assert_awaited_once()
+        assert [spec["field_api_name"] for spec in create_mock.await_args.args[1]] == [
+            "Score__c",
+            "Bad__c",
+        ]
+        assert [c["api_name"] for c in result["components"]] == [
+            "Lead.Score__c",
+            "Lead.",
+            "Lead.Bad__c",
+        ]
+        assert result["components"][0] == {
+            "type": "custom_field",
+            "api_name": "Lead.Score__c",
+            "success": True,
+            "sfdc_id": "00NScore__c",
+        }
+        assert result["components"][2]["error"] == {
+            "code": "DUPLICATE_DEVELOPER_NAME",
+            "message": "dup",
+        }
+        assert result["fields_created"] == 1
+        assert result["status"] == "partial"
+
+    @pytest.mark.asyncio
+    async def test_http_error_becomes_failed_component(self):
+        plan = {
+            "standard_object_fields": [
+                {"object": "Lead", "fields": [{"api_name": "Score__c", "type": "Number"}]}
+            ]
+        }
+        error = HTTPException(
+            status_code=502,
+            detail={"code": "nango_connection_unavailable", "message": "unavailable"},
+        )
+        with patch.object(
+            deploy_service.salesforce,
+            "tooling_composite_create_fields",
+            AsyncMock(side_effect=error),
+        ):
+            result = await _deploy(plan)
+
+        assert result["components"][0]["success"] is False
+        assert result["components"][0]["error"] == {
+            "code": "nango_connection_unavailable",
+            "message": "unavailable",
+        }
+        assert result["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_large_field_lists_are_split_into_composite_batches(self):
+        fields = [{"api_name": f"F{i}__c", "type": "Text"} for i in range(30)]
+        plan = {"standard_object_fields": [{"object": "Lead", "fields": fields}]}
+
+        async def create_fields(nango_connection_id, specs, provider_config_key=None):
+            return [{"id": f"00N{spec['field_api_name']}", "success": True, "errors": []} for spec in specs]
+
+        with patch.object(
+            deploy_service.salesforce,
+            "tooling_composite_create_fields",
+            AsyncMock(side_effect=create_fields),
+        ) as create_mock:
+            result = await _deploy(plan)
+
+        assert sorted(len(c.args[1]) for c in create_mock.await_args_list) == [5, 25]
+        assert [c["sfdc_id"] for c in result["components"]] == [f"00NF{i}__c" for i in range(30)]
+        assert result["fields_created"] == 30
+
+
+class TestCustomObjectVerification:
+    @pytest.mark.asyncio
+    async def test_malformed_custom_objects_are_rejected_before_deploy(self):
+        plan = {"custom_objects": [{"api_name": "Job__c", "label": "Job", "fields": [{"label": "X"}]}]}
+        with patch.object(deploy_service.salesforce, "metadata_deploy_and_poll", AsyncMock()) as deploy_mock:
+            with pytest.raises(HTTPException) as exc_info:
+                await _deploy(plan)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail["code"] == "invalid_deploy_plan"
+        assert exc_info.value.detail["errors"] == [
+            {"field": "custom_objects[0].fields[0].api_name", "message": "api_name must be a non-empty string"},
+            {"field": "custom_objects[0].fields[0].type", "message": "type must be a non-empty string"},
+        ]
+        deploy_mock.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reported_validation_errors_are_capped(self):
+        fields = [{"label": f"X{i}"} for i in range(30)]
+        plan = {"custom_objects": [{"api_name": "Job__c", "label": "Job", "fields": fields}]}
+        with pytest.raises(HTTPException) as exc_info:
+            await _deploy(plan)
+
+        assert len(exc_info.value.detail["errors"]) == deploy_service.MAX_REPORTED_VALIDATION_ERRORS
+
+    @pytest.mark.asyncio
+    async def test_missing_fields_are_backfilled_after_bulk_lookup(self):
+        async def tooling_query(nango_connection_id, soql, provider_config_key=None):
+            if "FROM CustomObject" in soql:
+                return [{"Id": "01I000000000001AAA", "DeveloperName": "Job"}]
+            return [
+                {"Id": "00N000000000001", "DeveloperName": "Title", "TableEnumOrId": "01I000000000001"}
+            ]
+
+        plan = {
+            "custom_objects": [
+                {
+                    "api_name": "Job__c",
+                    "label": "Job",
+                    "plural_label": "Jobs",
+                    "fields": [
+                        {"api_name": "Title__c", "label": "Title", "type": "Text"},
+                        {"api_name": "Salary__c", "label": "Salary", "type": "Currency"},
+                    ],
+                }
+            ]
+        }
+        deploy_mock = AsyncMock(return_value={"deployResult": {"status": "Succeeded"}})
+        query_mock = AsyncMock(side_effect=tooling_query)
+        create_mock = AsyncMock(
+            return_value=[{"id": "00N000000000002", "success": True, "errors": []}]
+        )
+        with patch.object(deploy_service.salesforce, "metadata_deploy_and_poll", deploy_mock), patch.object(
+            deploy_service.salesforce, "tooling_query", query_mock
+        ), patch.object(deploy_service.salesforce, "tooling_composite_create_fields", create_mock):
+            result = await _deploy(plan)
+
+        field_queries = [c.args[1] for c in query_mock.await_args_list if "FROM CustomField" in c.args[1]]
+        assert len(field_queries) == 1
+        create_mock.assert_awaited_once()
+        assert [spec["field_api_name"] for spec in create_mock.await_args.args[1]] == ["Salary__c"]
+        assert [(c["api_name"], c["success"], c["sfdc_id"]) for c in result["components"]] == [
+            ("Job__c", True, None),
+            ("Job__c.Title__c", True, "00N000000000001"),
+            ("Job__c.Salary__c", True, "00N000000000002"),
+        ]
+        assert result["objects_created"] == 1
+        assert result["fields_created"] == 2
+        assert result["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_fields_with_deploy_ids_skip_verification(self):
+        plan = {
+            "custom_objects": [
+                {
+                    "api_name": "Job__c",
+                    "label": "Job",
+                    "plural_label": "Jobs",
+                    "fields": [{"api_name": "Title__c", "label": "Title", "type": "Text"}],
+                }
+            ]
+        }
+        metadata_result = {
+            "deployResult": {
+                "status": "Succeeded",
+                "details": {
+                    "componentSuccesses": [
+                        {"fullName": "Job__c", "id": "01I000000000001"},
+                        {"fullName": "Job__c.Title__c", "id": "00N000000000001"},
+                    ]
+                },
+            }
+        }
+        query_mock = AsyncMock()
+        with patch.object(
+            deploy_service.salesforce, "metadata_deploy_and_poll", AsyncMock(return_value=metadata_result)
+        ), patch.object(deploy_service.salesforce, "tooling_query", query_mock):
+            result = await _deploy(plan)
+
+        query_mock.assert_not_awaited()
+        assert [(c["api_name"], c["sfdc_id"]) for c in result["components"]] == [
+            ("Job__c", "01I000000000001"),
+            ("Job__c.Title__c", "00N000000000001"),
+        ]
+        assert result["status"] == "succeeded"
+
+
+class TestDeployPipelining:
+    _CUSTOM_OBJECT = {
+        "api_name": "Job__c",
+        "label": "Job",
+        "plural_label": "Jobs",
+        "fields": [],
+    }
+
+    @staticmethod
+    async def _create_fields(nango_connection_id, specs, provider_config_key=None):
+        return [{"id": "00N1", "success": True, "errors": []} for _ in specs]
+
+    @pytest.mark.asyncio
+    async def test_standard_fields_overlap_metadata_deploy(self):
+        standard_fields_started = asyncio.Event()
+
+        async def deploy_and_poll(**kwargs):
+            await asyncio.wait_for(standard_fields_started.wait(), timeout=1)
+            return {"deployResult": {"status": "Succeeded"}}
+
+        async def create_fields(*args, **kwargs):
+            standard_fields_started.set()
+            return await self._create_fields(*args, **kwargs)
+
+        plan = {
+            "custom_objects": [self._CUSTOM_OBJECT],
+            "standard_object_fields": [
+                {"object": "Lead", "fields": [{"api_name": "Score__c", "type": "Number"}]}
+            ],
+        }
+        with patch.object(
+            deploy_service.salesforce, "metadata_deploy_and_poll", AsyncMock(side_effect=deploy_and_poll)
+        ), patch.object(
+            deploy_service.salesforce, "tooling_composite_create_fields", AsyncMock(side_effect=create_fields)
+        ):
+            result = await _deploy(plan)
+
+        assert [c["api_name"] for c in result["components"]] == ["Job__c", "Lead.Score__c"]
+        assert result["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_lookup_to_planned_object_waits_for_metadata_deploy(self):
+        calls: list[str] = []
+
+        async def deploy_and_poll(**kwargs):
+            calls.append("deploy")
+            return {"deployResult": {"status": "Succeeded"}}
+
+        async def create_fields(*args, **kwargs):
+            calls.append("fields")
+            return await self._create_fields(*args, **kwargs)
+
+        plan = {
+            "custom_objects": [self._CUSTOM_OBJECT],
+            "standard_object_fields": [
+                {
+                    "object": "Lead",
+                    "fields": [{"api_name": "Job__c", "type": "Lookup", "related_to": "Job__c"}],
+                }
+            ],
+        }
+        with patch.object(
+            deploy_service.salesforce, "metadata_deploy_and_poll", AsyncMock(side_effect=deploy_and_poll)
+        ), patch.object(
+            deploy_service.salesforce, "tooling_composite_create_fields", AsyncMock(side_effect=create_fields)
+        ):
+            await _deploy(plan)
+
+        assert calls == ["deploy", "fields"]
+
+
+class TestBuildFieldMetadata:
+    def test_text_defaults_length(self):
+        metadata = deploy_service._build_field_metadata({"api_name": "Notes__c", "type": "Text"})
+
+        assert metadata == {"type": "Text", "label": "Notes__c", "length": 255}
+
+    def test_picklist_values_are_normalized(self):
+        metadata = deploy_service._build_field_metadata(
+            {"api_name": "Stage__c", "type": "Picklist", "values": ["Open", "Closed"]}
+        )
+
+        values = metadata["valueSet"]["valueSetDefinition"]["value"]
+        assert [(v["fullName"], v["default"]) for v in values] == [("Open", True), ("Closed", False)]
+
+    def test_lookup_derives_relationship_name(self):
+        metadata = deploy_service._build_field_metadata(
+            {"api_name": "Account__c", "type": "Lookup", "related_to": "Account", "required": True}
+        )
+
+        assert metadata == {
+            "type": "Lookup",
+            "label": "Account__c",
+            "required": True,
+            "referenceTo": "Account",
+            "relationshipName": deploy_service._derive_relationship_name("Account__c"),
+            "deleteConstraint": "SetNull",
+        }
+
+    def test_picklist_values_mix_strings_and_dicts(self):
+        values = deploy_service._build_picklist_values(
+            ["Open", {"value": "Closed", "default": True}, 3, {"label": "Lost", "isActive": False}]
+        )
+
+        assert values == [
+            {"fullName": "Open", "default": True, "label": "Open", "isActive": True},
+            {"fullName": "Closed", "default": True, "label": "Closed", "isActive": True},
+            {"fullName": "Lost", "default": False, "label": "Lost", "isActive": False},
+        ]
+
+
+class TestSoqlEscape:
+    def test_values_without_quotes_or_backslashes_are_returned_unchanged(self):
+        value = "Job Title-1"
+        assert deploy_service._soql_escape(value) is value
+
+    def test_quotes_and_backslashes_are_escaped(self):
+        assert deploy_service._soql_escape("O'Brien\\x") == "O\\'Brien\\\\x"
+
+
+async def _delete_all(nango_connection_id, sobject_type, record_ids, provider_config_key=None):
+    return [{"id": record_id, "success": True, "errors": []} for record_id in record_ids]
+
+
+class TestExecuteRollback:
+    @pytest.mark.asyncio
+    async def test_fields_resolved_in_bulk_and_deleted_in_reverse_order(self):
+        async def tooling_query(nango_connection_id, soql, provider_config_key=None):
+            assert "FROM CustomField" in soql
+            return [
+                {"Id": "00N000000000001", "DeveloperName": "Score", "TableEnumOrId": "Lead"},
+                {"Id": "00N000000000002", "DeveloperName": "Tier", "TableEnumOrId": "Account"},
+            ]
+
+        deployment_result = {
+            "components": [
+                {"type": "custom_field", "api_name": "Lead.Score__c", "success": True},
+                {"type": "custom_field", "api_name": "Account.Tier__c", "success": True},
+                {"type": "custom_field", "api_name": "Lead.Missing__c", "success": True},
+                {"type": "custom_field", "api_name": "Lead.Failed__c", "success": False},
+            ]
+        }
+        query_mock = AsyncMock(side_effect=tooling_query)
+        delete_mock = AsyncMock(side_effect=_delete_all)
+        with patch.object(deploy_service.salesforce, "tooling_query", query_mock), patch.object(
+            deploy_service.salesforce, "tooling_composite_delete", delete_mock
+        ):
+            result = await deploy_service.execute_rollback("nango-1", deployment_result)
+
+        query_mock.assert_awaited_once()
+        delete_mock.assert_awaited_once()
+        assert delete_mock.await_args.args[1:] == (
+            "CustomField",
+            ["00N000000000002", "00N000000000001"],
+        )
+        assert [(c["api_name"], c["success"]) for c in result["components"]] == [
+            ("Lead.Missing__c", False),
+            ("Account.Tier__c", True),
+            ("Lead.Score__c", True),
+        ]
+        assert result["components"][0]["error"]["code"] == "not_found"
+        assert result["status"] == "partial"
+
+    @pytest.mark.asyncio
+    async def test_fields_of_deleted_objects_are_skipped(self):
+        deployment_result = {
+            "components": [
+                {"type": "custom_object", "api_name": "Job__c", "success": True, "sfdc_id": "01I1"},
+                {"type": "custom_field", "api_name": "Job__c.Title__c", "success": True},
+            ]
+        }
+        with patch.object(
+            deploy_service.salesforce,
+            "metadata_deploy_and_poll",
+            AsyncMock(return_value={"deployResult": {"status": "Succeeded"}}),
+        ), patch.object(deploy_service.salesforce, "tooling_query", AsyncMock()) as query_mock, patch.object(
+            deploy_service.salesforce, "tooling_composite_delete", AsyncMock()
+        ) as delete_mock:
+            result = await deploy_service.execute_rollback("nango-1", deployment_result)
+
+        query_mock.assert_not_awaited()
+        delete_mock.assert_not_awaited()
+        assert result["components"] == [
+            {
+                "type": "custom_field",
+                "api_name": "Job__c.Title__c",
+                "success": True,
+                "sfdc_id": None,
+                "skipped": True,
+                "reason": "Deleted with parent custom object",
+            },
+            {"type": "custom_object", "api_name": "Job__c", "success": True, "sfdc_id": "01I1"},
+        ]
+        assert result["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_fields_are_deleted_when_parent_object_delete_fails(self):
+        deployment_result = {
+            "components": [
+                {"type": "custom_object", "api_name": "Job__c", "success": True, "sfdc_id": "01I1"},
+                {"type": "custom_field", "api_name": "Job__c.Title__c", "success": True, "sfdc_id": "00N1"},
+                {"type": "custom_object", "api_name": "Shift__c", "success": True},
+            ]
+        }
+        metadata_result = {
+            "deployResult": {
+                "status": "Failed",
+                "details": {
+                    "componentFailures": {
+                        "fullName": "Shift__c",
+                        "problemType": "Error",
+                        "problem": "in use",
+                    }
+                },
+            }
+        }
+        delete_mock = AsyncMock(side_effect=_delete_all)
+        with patch.object(
+            deploy_service.salesforce,
+            "metadata_deploy_and_poll",
+            AsyncMock(return_value=metadata_result),
+        ), patch.object(
+            deploy_service.salesforce,
+            "tooling_query",
+            AsyncMock(return_value=[]),
+        ), patch.object(deploy_service.salesforce, "tooling_composite_delete", delete_mock):
+            result = await deploy_service.execute_rollback("nango-1", deployment_result)
+
+        delete_mock.assert_awaited_once()
+        assert delete_mock.await_args.args[2] == ["00N1"]
+        assert result["components"] == [
+            {"type": "custom_field", "api_name": "Job__c.Title__c", "success": True, "sfdc_id": "00N1"},
+            {
+                "type": "custom_object",
+                "api_name": "Shift__c",
+                "success": False,
+                "sfdc_id": None,
+                "error": {"code": "Error", "message": "in use"},
+            },
+            {
+                "type": "custom_object",
+                "api_name": "Job__c",
+                "success": False,
+                "sfdc_id": "01I1",
+                "error": {
+                    "code": "metadata_deploy_failed",
+                    "message": "Destructive deploy ended with status Failed",
+                },
+            },
+        ]
+        assert result["status"] == "partial"
+
+    @pytest.mark.asyncio
+    async def test_deletes_are_batched_with_per_record_failures(self):
+        fields = [f"Field{index}" for index in range(30)]
+
+        async def tooling_query(nango_connection_id, soql, provider_config_key=None):
+            return [
+                {"Id": f"00N{index:03d}", "DeveloperName": name, "TableEnumOrId": "Lead"}
+                for index, name in enumerate(fields)
+            ]
+
+        async def delete(nango_connection_id, sobject_type, record_ids, provider_config_key=None):
+            return [
+                {"id": record_id, "success": record_id != "00N007", "errors": [{"errorCode": "IN_USE"}]}
+                for record_id in record_ids
+            ]
+
+        deployment_result = {
+            "components": [
+                {"type": "custom_field", "api_name": f"Lead.{name}__c", "success": True} for name in fields
+            ]
+        }
+        delete_mock = AsyncMock(side_effect=delete)
+        with patch.object(
+            deploy_service.salesforce, "tooling_query", AsyncMock(side_effect=tooling_query)
+        ), patch.object(deploy_service.salesforce, "tooling_composite_delete", delete_mock):
+            result = await deploy_service.execute_rollback("nango-1", deployment_result)
+
+        assert [len(c.args[2]) for c in delete_mock.await_args_list] == [25, 5]
+        failed = [c for c in result["components"] if not c["success"]]
+        assert [(c["api_name"], c["error"]["code"]) for c in failed] == [("Lead.Field7__c", "IN_USE")]
+        assert result["rolled_back_components"] == 29
+
+    @pytest.mark.asyncio
+    async def test_per_field_fallback_shares_parent_object_lookup(self):
+        async def tooling_query(nango_connection_id, soql, provider_config_key=None):
+            if " IN (" in soql:
+                raise HTTPException(status_code=502, detail={"code": "QUERY_TIMEOUT", "message": "slow"})
+            if "FROM CustomObject" in soql:
+                return [{"Id": "01I000000000001AAA"}]
+            return [{"Id": "00N000000000001"}]
+
+        deployment_result = {
+            "components": [
+                {"type": "custom_field", "api_name": "Job__c.Title__c", "success": True},
+                {"type": "custom_field", "api_name": "Job__c.Salary__c", "success": True},
+            ]
+        }
+        query_mock = AsyncMock(side_effect=tooling_query)
+        with patch.object(deploy_service.salesforce, "tooling_query", query_mock), patch.object(
+            deploy_service.salesforce, "tooling_composite_delete", AsyncMock(side_effect=_delete_all)
+        ):
+            result = await deploy_service.execute_rollback("nango-1", deployment_result)
+
+        object_queries = [
+            c.args[1]
+            for c in query_mock.await_args_list
+            if "FROM CustomObject" in c.args[1] and " IN (" not in c.args[1]
+        ]
+        assert len(object_queries) == 1
+        assert result["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_unrelated_field_deletes_overlap_destructive_deploy(self):
+        fields_deleted = asyncio.Event()
+
+        async def deploy_and_poll(**kwargs):
+            await asyncio.wait_for(fields_deleted.wait(), timeout=1)
+            return {"deployResult": {"status": "Succeeded"}}
+
+        async def delete(*args, **kwargs):
+            fields_deleted.set()
+            return await _delete_all(*args, **kwargs)
+
+        deployment_result = {
+            "components": [
+                {"type": "custom_object", "api_name": "Job__c", "success": True, "sfdc_id": "01I1"},
+                {"type": "custom_field", "api_name": "Job__c.Title__c", "success": True},
+                {"type": "custom_field", "api_name": "Lead.Score__c", "success": True, "sfdc_id": "00N1"},
+            ]
+        }
+        plan = {
+            "custom_objects": [{"api_name": "Job__c", "fields": [{"api_name": "Title__c", "type": "Text"}]}],
+            "standard_object_fields": [{"object": "Lead", "fields": [{"api_name": "Score__c", "type": "Number"}]}],
+        }
+        delete_mock = AsyncMock(side_effect=delete)
+        with patch.object(
+            deploy_service.salesforce, "metadata_deploy_and_poll", AsyncMock(side_effect=deploy_and_poll)
+        ), patch.object(
+            deploy_service.salesforce, "tooling_query", AsyncMock(return_value=[])
+        ), patch.object(deploy_service.salesforce, "tooling_composite_delete", delete_mock):
+            result = await deploy_service.execute_rollback("nango-1", deployment_result, deployment_plan=plan)
+
+        delete_mock.assert_awaited_once()
+        assert delete_mock.await_args.args[2] == ["00N1"]
+        assert [(c["api_name"], c["success"], c.get("skipped")) for c in result["components"]] == [
+            ("Lead.Score__c", True, None),
+            ("Job__c.Title__c", True, True),
+            ("Job__c", True, None),
+        ]
+        assert result["status"] == "succeeded"
+
+
+    @pytest.mark.asyncio
+    async def test_lookups_onto_dropping_objects_are_deleted_before_the_drop(self):
+        events: list[str] = []
+
+        async def deploy_and_poll(**kwargs):
+            events.append("drop")
+            return {"deployResult": {"status": "Succeeded"}}
+
+        async def delete(*args, **kwargs):
+            events.append("delete")
+            return await _delete_all(*args, **kwargs)
+
+        deployment_result = {
+            "components": [
+                {"type": "custom_object", "api_name": "Job__c", "success": True, "sfdc_id": "01I1"},
+                {"type": "custom_field", "api_name": "Account.Job__c", "success": True, "sfdc_id": "00N1"},
+            ]
+        }
+        plan = {
+            "custom_objects": [{"api_name": "Job__c", "fields": []}],
+            "standard_object_fields": [
+                {"object": "Account", "fields": [{"api_name": "Job__c", "type": "Lookup", "related_to": "Job__c"}]}
+            ],
+        }
+        with patch.object(
+            deploy_service.salesforce, "metadata_deploy_and_poll", AsyncMock(side_effect=deploy_and_poll)
+        ), patch.object(
+            deploy_service.salesforce, "tooling_query", AsyncMock(return_value=[])
+        ), patch.object(deploy_service.salesforce, "tooling_composite_delete", AsyncMock(side_effect=delete)):
+            result = await deploy_service.execute_rollback("nango-1", deployment_result, deployment_plan=plan)
+
+        assert events == ["delete", "drop"]
+        assert [(c["api_name"], c["success"]) for c in result["components"]] == [
+            ("Account.Job__c", True),
+            ("Job__c", True),
+        ]
+        assert result["rolled_back_components"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fields_outside_the_plan_are_deleted_before_the_drop(self):
+        events: list[str] = []
+
+        async def deploy_and_poll(**kwargs):
+            events.append("drop")
+            return {"deployResult": {"status": "Succeeded"}}
+
+        async def delete(*args, **kwargs):
+            events.append("delete")
+            return await _delete_all(*args, **kwargs)
+
+        deployment_result = {
+            "components": [
+                {"type": "custom_object", "api_name": "Job__c", "success": True, "sfdc_id": "01I1"},
+                {"type": "custom_field", "api_name": "Job__c.Title__c", "success": True},
+                {"type": "custom_field", "api_name": "Contact.Job__c", "success": True, "sfdc_id": "00N1"},
+            ]
+        }
+        with patch.object(
+            deploy_service.salesforce, "metadata_deploy_and_poll", AsyncMock(side_effect=deploy_and_poll)
+        ), patch.object(
+            deploy_service.salesforce, "tooling_query", AsyncMock(return_value=[])
+        ), patch.object(deploy_service.salesforce, "tooling_composite_delete", AsyncMock(side_effect=delete)):
+            result = await deploy_service.execute_rollback("nango-1", deployment_result)
+
+        assert events == ["delete", "drop"]
+        assert [(c["api_name"], c.get("skipped", False)) for c in result["components"]] == [
+            ("Contact.Job__c", False),
+            ("Job__c.Title__c", True),
+            ("Job__c", False),
+        ]
+        assert result["status"] == "succeeded"
+
+class TestMaterializeComponentResults:
+    def test_maps_successes_failures_and_status_fallback(self):
+        metadata_result = {
+            "deployResult": {
+                "status": "Failed",
+                "details": {
+                    "componentSuccesses": [{"fullName": "Lead", "id": "04Q1"}],
+                    "componentFailures": [
+                        {"fullName": "Bad_Flow", "problemType": "Error", "problem": "invalid"}
+                    ],
+                },
+            }
+        }
+
+        results, counts = deploy_service._materialize_component_results(
+            [("assignment_rule", "Lead"), ("flow", "Bad_Flow"), ("flow", "Missing_Flow")],
+            metadata_result,
+            deploy_label="Destructive deploy",
+        )
+
+        assert results == [
+            {"type": "assignment_rule", "api_name": "Lead", "success": True, "sfdc_id": "04Q1"},
+            {
+                "type": "flow",
+                "api_name": "Bad_Flow",
+                "success": False,
+                "sfdc_id": None,
+                "error": {"code": "Error", "message": "invalid"},
+            },
+            {
+                "type": "flow",
+                "api_name": "Missing_Flow",
+                "success": False,
+                "sfdc_id": None,
+                "error": {
+                    "code": "metadata_deploy_failed",
+                    "message": "Destructive deploy ended with status Failed",
+                },
+            },
+        ]
+        assert counts == {"assignment_rule": 1}
+
+    def test_succeeded_status_marks_unlisted_components_successful(self):
+        results, counts = deploy_service._materialize_component_results(
+            [("report", "Folder/Report"), ("report_folder", "Folder")],
+            {"deployResult": {"status": "Succeeded"}},
+        )
+
+        assert [r["success"] for r in results] == [True, True]
+        assert counts == {"report": 1, "report_folder": 1}
+
+    def test_failure_components_share_one_normalized_error(self):
+        results = deploy_service._metadata_failure_components(
+            [("flow", "A"), ("assignment_rule", "Lead")],
+            "Salesforce unavailable",
+        )
+
+        assert results == [
+            {
+                "type": "flow",
+                "api_name": "A",
+                "success": False,
+                "error": {"code": "unknown_error", "message": "Salesforce unavailable"},
+            },
+            {
+                "type": "assignment_rule",
+                "api_name": "Lead",
+                "success": False,
+                "error": {"code": "unknown_error", "message": "Salesforce unavailable"},
+            },
+        ]
+        assert results[0]["error"] is results[1]["error"]
+
+
+class TestDedupePlannedComponents:
+    @pytest.mark.asyncio
+    async def test_workflow_removal_reports_each_component_once(self):
+        deploy_mock = AsyncMock(return_value={"deployResult": {"status": "Succeeded"}})
+        with patch.object(deploy_service.salesforce, "metadata_deploy_and_poll", deploy_mock):
+            result = await deploy_service.execute_workflow_removal(
+                "conn-1",
+                ["Lead_Flow", " Lead_Flow ", "Other_Flow"],
+                ["Lead", "Lead"],
+            )
+
+        assert [(c["type"], c["api_name"]) for c in result["components"]] == [
+            ("flow", "Lead_Flow"),
+            ("flow", "Other_Flow"),
+            ("assignment_rule", "Lead"),
+        ]
+        assert result["flows_removed"] == 2
+        assert result["assignment_rules_removed"] == 1
+
+
+class TestExecuteAnalyticsRollback:
+    @pytest.mark.asyncio
+    async def test_successful_components_are_bucketed_and_deduplicated(self):
+        deployment_result = {
+            "components": [
+                {"type": "report_folder", "api_name": "Sales", "success": True},
+                {"type": "report", "api_name": "Sales/Pipeline", "success": True},
+                {"type": "report", "api_name": " Sales/Pipeline ", "success": True},
+                {"type": "dashboard", "api_name": "Sales/Overview", "success": False},
+                {"type": "flow", "api_name": "Other", "success": True},
+            ]
+        }
+        with patch.object(
+            deploy_service.metadata_builder, "build_analytics_destructive_deploy_zip", return_value=b"zip"
+        ) as build_mock, patch.object(
+            deploy_service.salesforce,
+            "metadata_deploy_and_poll",
+            AsyncMock(return_value={"deployResult": {"status": "Succeeded"}}),
+        ):
+            result = await deploy_service.execute_analytics_rollback("nango-1", deployment_result)
+
+        build_mock.assert_called_once_with(
+            report_folders=["Sales"],
+            dashboard_folders=[],
+            reports=["Sales/Pipeline"],
+            dashboards=[],
+        )
+        assert [(c["type"], c["api_name"]) for c in result["components"]] == [
+            ("report", "Sales/Pipeline"),
+            ("report_folder", "Sales"),
+        ]
+        assert result["rolled_back_components"] == 2
+
+
+class TestPlannedAnalyticsComponents:
+    def test_foldered_entries_are_prefixed_with_folder(self):
+        planned = deploy_service._planned_analytics_components(
+            [
+                {"api_name": " Pipeline ", "folder": "Sales"},
+                {"api_name": "Forecast", "folder": " Finance "},
+            ],
+            "report",
+            in_folder=True,
+        )
+
+        assert planned == [("report", "Sales/Pipeline"), ("report", "Finance/Forecast")]
+
+    def test_missing_section_is_empty(self):
+        assert deploy_service._planned_analytics_components(None, "report_folder") == []
+
+
+class TestAutoMapCustomObjects:
+    @pytest.mark.asyncio
+    async def test_upserts_all_objects_in_one_executemany(self):
+        pool = AsyncMock()
+        components = [
+            {"type": "custom_object", "api_name": "Job__c", "success": True},
+            {"type": "custom_field", "api_name": "Job__c.Title__c", "success": True},
+            {"type": "custom_field", "api_name": "Job__c.Salary__c", "success": False},
+            {"type": "custom_object", "api_name": "Applicant__c", "success": True},
+        ]
+
+        await deploy_service._best_effort_auto_map_custom_objects(
+            pool=pool,
+            org_id="org-1",
+            client_id="client-1",
+            components=components,
+        )
+
+        pool.execute.assert_not_awaited()
+        pool.executemany.assert_awaited_once()
+        assert pool.executemany.await_args.args[1] == [
+            ("org-1", "client-1", "Applicant__c", "Applicant__c", {}),
+            ("org-1", "client-1", "Job__c", "Job__c", {"Title__c": "Title__c"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_successful_objects_skips_database(self):
+        pool = AsyncMock()
+
+        await deploy_service._best_effort_auto_map_custom_objects(
+            pool=pool,
+            org_id="org-1",
+            client_id="client-1",
+            components=[{"type": "custom_object", "api_name": "Job__c", "success": False}],
+        )
+
+        pool.executemany.assert_not_awaited()
+
+
+class TestEmptyMetadataDeploys:
+    @pytest.mark.asyncio
+    async def test_empty_workflow_removal_is_noop_without_deploy(self):
+        deploy_mock = AsyncMock()
+        with patch.object(deploy_service.salesforce, "metadata_deploy_and_poll", deploy_mock):
+            first = await deploy_service.execute_workflow_removal("conn-1", [" "], [])
+            second = await deploy_service.execute_workflow_removal("conn-1", [], [])
+
+        deploy_mock.assert_not_awaited()
+        assert first == {
+            "status": "noop",
+            "flows_removed": 0,
+            "assignment_rules_removed": 0,
+            "components": [],
+        }
+        assert first["components"] is not second["components"]
+
+    @pytest.mark.asyncio
+    async def test_empty_analytics_rollback_is_noop(self):
+        deploy_mock = AsyncMock()
+        with patch.object(deploy_service.salesforce, "metadata_deploy_and_poll", deploy_mock):
+            result = await deploy_service.execute_analytics_rollback(
+                "conn-1",
+                {"components": [{"type": "report", "api_name": "Sales/Pipeline", "success": False}]},
+            )
+
+        deploy_mock.assert_not_awaited()
+        assert result["status"] == "noop"
+        assert result["rolled_back_components"] == 0
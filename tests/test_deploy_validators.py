@@ -0,0 +1,194 @@
+"""Tests for deployment plan validation."""
+
+import pytest
+
+from app.services import deploy_validators
+from app.services.deploy_validators import ValidationError
+
+
+class TestCustomObjectPlan:
+    def test_invalid_field_type_lists_allowed_types(self):
+        plan = {
+            "custom_objects": [
+                {
+                    "api_name": "Job__c",
+                    "label": "Job",
+                    "fields": [{"api_name": "X__c", "label": "X", "type": "Blob"}],
+                    "relationships": [{"api_name": "Y__c", "label": "Y", "type": "Text"}],
+                }
+            ]
+        }
+
+        assert deploy_validators.validate_custom_object_plan(plan) == [
+            ValidationError(
+                "custom_objects[0].fields[0].type",
+                "Invalid field type 'Blob'. Must be one of: Checkbox, Currency, Date, DateTime, "
+                "Email, LongTextArea, Lookup, MasterDetail, Number, Percent, Phone, Picklist, "
+                "Text, TextArea, Url",
+            ),
+            ValidationError(
+                "custom_objects[0].relationships[0].type",
+                "Invalid field type 'Text'. Must be one of: Lookup, MasterDetail",
+            ),
+        ]
+
+    def test_type_specific_checks_run_per_field_type(self):
+        fields = [
+            {"api_name": "A__c", "label": "A", "type": "Currency", "precision": 2, "scale": 4},
+            {"api_name": "B__c", "label": "B", "type": "Checkbox", "default": "yes"},
+            {"api_name": "C__c", "label": "C", "type": "Lookup"},
+            {"api_name": "D__c", "label": "D", "type": "Date", "length": -1},
+        ]
+        plan = {"custom_objects": [{"api_name": "Job__c", "label": "Job", "fields": fields}]}
+
+        errors = deploy_validators.validate_custom_object_plan(plan)
+
+        assert [error.field for error in errors] == [
+            "custom_objects[0].fields[0].precision",
+            "custom_objects[0].fields[1].default",
+            "custom_objects[0].fields[2].related_to",
+        ]
+
+    def test_booleans_are_not_accepted_as_integers(self):
+        field = {"api_name": "A__c", "label": "A", "type": "Text", "length": True}
+        plan = {"custom_objects": [{"api_name": "Job__c", "label": "Job", "fields": [field]}]}
+
+        assert deploy_validators.validate_custom_object_plan(plan) == [
+            ValidationError("custom_objects[0].fields[0].length", "length must be a positive integer")
+        ]
+
+
+class TestAnalyticsPlan:
+    def test_invalid_enum_values_list_allowed_values(self):
+        plan = {
+            "report_folders": [{"api_name": "Sales", "name": "Sales", "accessType": "Open"}],
+            "reports": [
+                {
+                    "api_name": "Pipeline",
+                    "folder": "Sales",
+                    "name": "Pipeline",
+                    "reportType": "Opportunity",
+                    "scope": "all",
+                }
+            ],
+        }
+
+        assert deploy_validators.validate_analytics_plan(plan) == [
+            ValidationError(
+                "report_folders[0].accessType",
+                "Invalid accessType 'Open'. Must be one of: Hidden, Public, PublicInternal, Shared",
+            ),
+            ValidationError(
+                "reports[0].scope",
+                "Invalid scope 'all'. Must be one of: everything, mine, organization, team, user",
+            ),
+        ]
+
+    def test_invalid_values_are_echoed_as_given(self):
+        report = {
+            "api_name": "Pipeline",
+            "folder": "Sales",
+            "name": "Pipeline",
+            "reportType": "Opportunity",
+            "scope": {"z": 1, "a": 2},
+        }
+        plan = {"report_folders": [{"api_name": "Sales", "name": "Sales"}], "reports": [report]}
+
+        assert deploy_validators.validate_analytics_plan(plan) == [
+            ValidationError(
+                "reports[0].scope",
+                "Invalid scope '{'z': 1, 'a': 2}'. Must be one of: everything, mine, organization, team, user",
+            ),
+        ]
+
+    def test_nested_required_strings_are_reported_with_paths(self):
+        plan = {
+            "report_folders": [{"api_name": "Sales", "name": "Sales"}],
+            "reports": [
+                {
+                    "api_name": "Pipeline",
+                    "folder": "Sales",
+                    "name": "Pipeline",
+                    "reportType": "Opportunity",
+                    "chart": {"chartType": "Pie", "chartSummaries": [{"aggregate": " Sum ", "column": ""}]},
+                    "groupingsDown": [{"field": 7}],
+                    "filter": {"criteriaItems": [{"column": "AMOUNT", "operator": "greaterThan"}]},
+                }
+            ],
+        }
+
+        assert [error.field for error in deploy_validators.validate_analytics_plan(plan)] == [
+            "reports[0].chart.chartSummaries[0].column",
+            "reports[0].groupingsDown[0].field",
+            "reports[0].filter.criteriaItems[0].value",
+        ]
+
+    def test_dashboard_components_must_reference_planned_reports(self):
+        plan = {
+            "report_folders": [{"api_name": "Sales", "name": "Sales"}],
+            "dashboard_folders": [{"api_name": "Boards", "name": "Boards"}],
+            "reports": [{"api_name": "Pipeline", "folder": "Sales", "name": "Pipeline", "reportType": "Opportunity"}],
+            "dashboards": [
+                {
+                    "api_name": "Overview",
+                    "folder": "Boards",
+                    "title": "Overview",
+                    "dashboardType": "LoggedInUser",
+                    "leftSection": [
+                        {"report": " Sales/Pipeline "},
+                        {"report": "Sales/Missing"},
+                        {"report": "   "},
+                        {"report": "Other/Existing", "pre_existing": True},
+                    ],
+                }
+            ],
+        }
+
+        assert deploy_validators.validate_analytics_plan(plan) == [
+            ValidationError(
+                "dashboards[0].leftSection[1].report",
+                "Dashboard component report 'Sales/Missing' not found in plan reports "
+                "and not marked as pre_existing",
+            ),
+            ValidationError("dashboards[0].leftSection[2].report", "report must be a non-empty string when provided"),
+        ]
+
+    def test_groupings_section_validates_in_isolation(self):
+        errors: list[ValidationError] = []
+        report = {"groupingsDown": [{"field": "STAGE", "sortOrder": "Up"}], "groupingsAcross": "CLOSE_DATE"}
+
+        deploy_validators._validate_groupings(report, "reports[0]", errors)
+
+        assert [error.field for error in errors] == [
+            "reports[0].groupingsDown[0].sortOrder",
+            "reports[0].groupingsAcross",
+        ]
+
+
+class TestValidationErrorDetails:
+    def test_errors_render_as_field_message_objects(self):
+        errors = deploy_validators.validate_workflow_plan("not a plan")
+
+        assert deploy_validators.validation_error_details(errors) == [
+            {"field": "plan", "message": "Plan must be an object"}
+        ]
+
+
+class TestMaxErrors:
+    _PLAN = {"flows": [{}, {}, {}]}
+
+    def test_validation_stops_at_max_errors(self):
+        errors = deploy_validators.validate_workflow_plan(self._PLAN, max_errors=3)
+
+        assert [error.field for error in errors] == [
+            "flows[0].api_name",
+            "flows[0].xml_content",
+            "flows[1].api_name",
+        ]
+
+    def test_unbounded_validation_reports_every_error(self):
+        assert len(deploy_validators.validate_workflow_plan(self._PLAN)) == 6
+
+    def test_max_errors_must_be_positive(self):
+        with pytest.raises(ValueError):
+            deploy_validators.validate_workflow_plan(self._PLAN, max_errors=0)
@@ -0,0 +1,25 @@
+"""Tests for Metadata API deploy zip packaging."""
+
+import io
+import zipfile
+
+from app.services import metadata_builder
+
+
+class TestZipBytes:
+    def test_identical_plans_build_identical_zips(self):
+        objects = [{"api_name": "Job__c", "label": "Job", "fields": [{"api_name": "Title__c", "type": "Text"}]}]
+
+        first = metadata_builder.build_custom_object_zip(objects)
+        second = metadata_builder.build_custom_object_zip(objects)
+
+        assert first == second
+
+    def test_members_are_deflated(self):
+        zip_bytes = metadata_builder.build_destructive_deploy_zip(["Job__c"])
+
+        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+            members = archive.infolist()
+            assert [member.filename for member in members] == ["package.xml", "destructiveChanges.xml"]
+            assert {member.compress_type for member in members} == {zipfile.ZIP_DEFLATED}
+            assert "Job__c" in archive.read("destructiveChanges.xml").decode()
@@ -0,0 +1,98 @@
+"""Tests for Salesforce client retry and polling behaviour."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.services import salesforce
+
+
+def _status(state: str) -> dict:
+    return {"deployResult": {"status": state}}
+
+
+class TestMetadataDeployAndPoll:
+    @pytest.mark.asyncio
+    async def test_poll_interval_backs_off_exponentially_up_to_cap(self):
+        statuses = [_status("InProgress")] * 6 + [_status("Succeeded")]
+        sleep_mock = AsyncMock()
+        with patch.object(salesforce, "metadata_deploy", AsyncMock(return_value="0Af1")), patch.object(
+            salesforce, "metadata_deploy_status", AsyncMock(side_effect=statuses)
+        ), patch.object(salesforce.asyncio, "sleep", sleep_mock), patch.object(
+            salesforce.random, "uniform", return_value=0.0
+        ):
+            result = await salesforce.metadata_deploy_and_poll("conn-1", b"zip")
+
+        assert result == _status("Succeeded")
+        assert [c.args[0] for c in sleep_mock.await_args_list] == [1.0, 2.0, 4.0, 8.0, 15.0, 15.0]
+
+    @pytest.mark.asyncio
+    async def test_transient_status_errors_are_retried(self):
+        statuses = [
+            httpx.ConnectError("reset"),
+            HTTPException(status_code=502, detail={"code": "SERVER_ERROR", "status_code": 503}),
+            _status("Failed"),
+        ]
+        with patch.object(salesforce, "metadata_deploy", AsyncMock(return_value="0Af1")), patch.object(
+            salesforce, "metadata_deploy_status", AsyncMock(side_effect=statuses)
+        ), patch.object(salesforce.asyncio, "sleep", AsyncMock()):
+            result = await salesforce.metadata_deploy_and_poll("conn-1", b"zip")
+
+        assert result == _status("Failed")
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        error = HTTPException(status_code=502, detail={"code": "INVALID_ID", "status_code": 404})
+        status_mock = AsyncMock(side_effect=error)
+        with patch.object(salesforce, "metadata_deploy", AsyncMock(return_value="0Af1")), patch.object(
+            salesforce, "metadata_deploy_status", status_mock
+        ), patch.object(salesforce.asyncio, "sleep", AsyncMock()):
+            with pytest.raises(HTTPException):
+                await salesforce.metadata_deploy_and_poll("conn-1", b"zip")
+
+        status_mock.assert_awaited_once()
+
+
+def _response(status_code: int, headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", "https://sfdc.test"))
+
+
+class TestSendWithRetry:
+    @pytest.mark.asyncio
+    async def test_idempotent_request_retries_server_errors(self):
+        send = AsyncMock(side_effect=[_response(503), httpx.ReadError("closed"), _response(200)])
+        with patch.object(salesforce.asyncio, "sleep", AsyncMock()) as sleep_mock:
+            response = await salesforce._send_with_retry(send, idempotent=True)
+
+        assert response.status_code == 200
+        assert send.await_count == 3
+        assert sleep_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_request_only_retries_unsent_failures(self):
+        send = AsyncMock(side_effect=[httpx.ConnectError("refused"), _response(503)])
+        with patch.object(salesforce.asyncio, "sleep", AsyncMock()):
+            response = await salesforce._send_with_retry(send, idempotent=False)
+
+        assert response.status_code == 503
+        assert send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_honours_retry_after(self):
+        send = AsyncMock(side_effect=[_response(429, {"Retry-After": "2"}), _response(201)])
+        with patch.object(salesforce.asyncio, "sleep", AsyncMock()) as sleep_mock:
+            response = await salesforce._send_with_retry(send, idempotent=False)
+
+        assert response.status_code == 201
+        sleep_mock.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_final_attempt(self):
+        send = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        with patch.object(salesforce.asyncio, "sleep", AsyncMock()):
+            with pytest.raises(httpx.ConnectError):
+                await salesforce._send_with_retry(send, idempotent=True)
+
+        assert send.await_count == salesforce.TRANSIENT_RETRY_ATTEMPTS
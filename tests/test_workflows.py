@@ -0,0 +1,104 @@
+"""Tests for background workflow deploys."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.routers import deploy, workflows
+
+
+def _start(pool) -> asyncio.Task:
+    task = asyncio.create_task(
+        workflows._run_workflow_deployment(
+            pool=pool,
+            deployment_id=uuid4(),
+            org_id="org-1",
+            connection_id=uuid4(),
+            nango_connection_id="nango-1",
+            provider_config_key=None,
+            plan={"flows": []},
+        )
+    )
+    workflows._background_deploy_tasks.add(task)
+    task.add_done_callback(workflows._background_deploy_tasks.discard)
+    return task
+
+
+class TestDrainBackgroundDeploys:
+    @pytest.mark.asyncio
+    async def test_finished_deploys_are_awaited(self):
+        pool = AsyncMock()
+        with patch.object(
+            workflows.deploy_service,
+            "execute_workflow_deployment",
+            AsyncMock(return_value={"status": "succeeded"}),
+        ), patch.object(workflows.connection_cache, "touch_last_used", AsyncMock()):
+            _start(pool)
+            await workflows.drain_background_deploys(timeout=1)
+
+        assert not workflows._background_deploy_tasks
+        assert pool.execute.await_args.args[2] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_background_deploy_skips_revalidating_the_plan(self):
+        execute_mock = AsyncMock(return_value={"status": "succeeded"})
+        with patch.object(workflows.deploy_service, "execute_workflow_deployment", execute_mock), patch.object(
+            workflows.connection_cache, "touch_last_used", AsyncMock()
+        ):
+            _start(AsyncMock())
+            await workflows.drain_background_deploys(timeout=1)
+
+        assert execute_mock.await_args.kwargs["validated"] is True
+
+    @pytest.mark.asyncio
+    async def test_deploys_past_timeout_are_cancelled_and_marked_failed(self):
+        pool = AsyncMock()
+
+        async def never_finishes(**kwargs):
+            await asyncio.Event().wait()
+
+        touch_mock = AsyncMock()
+        with patch.object(
+            workflows.deploy_service, "execute_workflow_deployment", AsyncMock(side_effect=never_finishes)
+        ), patch.object(workflows.connection_cache, "touch_last_used", touch_mock):
+            task = _start(pool)
+            await asyncio.sleep(0)
+            await workflows.drain_background_deploys(timeout=0.01)
+
+        assert task.cancelled()
+        assert "'failed'::deployment_status" in pool.execute.await_args.args[0]
+        assert pool.execute.await_args.args[1] == workflows._SHUTDOWN_INTERRUPTED_MESSAGE
+        touch_mock.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deploys_queued_on_the_semaphore_are_marked_failed(self):
+        pool = AsyncMock()
+
+        async def never_finishes(**kwargs):
+            await asyncio.Event().wait()
+
+        queued = workflows._MAX_CONCURRENT_BACKGROUND_DEPLOYS + 2
+        with patch.object(
+            workflows, "_background_deploy_semaphore", asyncio.Semaphore(workflows._MAX_CONCURRENT_BACKGROUND_DEPLOYS)
+        ), patch.object(
+            workflows.deploy_service, "execute_workflow_deployment", AsyncMock(side_effect=never_finishes)
+        ), patch.object(workflows.connection_cache, "touch_last_used", AsyncMock()):
+            tasks = [_start(pool) for _ in range(queued)]
+            await asyncio.sleep(0)
+            await workflows.drain_background_deploys(timeout=0.01)
+
+        assert all(task.cancelled() for task in tasks)
+        interrupted = [
+            call for call in pool.execute.await_args_list if call.args[1] == workflows._SHUTDOWN_INTERRUPTED_MESSAGE
+        ]
+        assert len(interrupted) == queued
+
+
+class TestResolveDbDeploymentStatus:
+    @pytest.mark.parametrize("resolve", [workflows._resolve_db_deployment_status, deploy._resolve_db_deployment_status])
+    def test_noop_is_stored_as_succeeded(self, resolve):
+        assert resolve("noop") == "succeeded"
+        assert resolve("partial") == "partial"
+        assert resolve("unknown") == "failed"